@@ -4,14 +4,45 @@ This module provides the application factory pattern for creating and configurin
 Flask application instances with all necessary extensions, routes, and error handlers.
 """
 
+import importlib
+import logging
 import time
+from types import ModuleType
 from typing import Any, Optional
 
-from dotenv import load_dotenv
-from flask import Flask, Response, g, request
+from flask import Flask, Response, current_app, g, request
+
+from app.config import BaseConfig, get_config, load_env
 
 # Load environment variables from .env file
-load_dotenv()
+load_env()
+
+# Query parameter names (lowercase) never written to the debug request logs
+_SENSITIVE_PARAMS = frozenset({"api_key", "password", "token", "secret"})
+
+# Access logger; a child of the "app" logger (Flask's app.logger), so records
+# reach the handlers installed by configure_logging and honour its level
+_request_logger = logging.getLogger("app.request")
+
+# Submodules resolved by the factory helpers. Cached per process so that repeated
+# create_app() calls (one per test, one per worker) skip the import machinery.
+_LOADED: dict[str, ModuleType] = {}
+
+
+def _load(module_name: str) -> ModuleType:
+    """Import an application submodule once and return the cached module.
+
+    Args:
+        module_name (str): Dotted path of the module to import.
+
+    Returns:
+        ModuleType: The imported module.
+
+    """
+    module = _LOADED.get(module_name)
+    if module is None:
+        module = _LOADED[module_name] = importlib.import_module(module_name)
+    return module
 
 
 def create_app(test_config: Optional[dict[str, "Any"]] = None) -> Flask:
@@ -45,6 +76,10 @@ def create_app(test_config: Optional[dict[str, "Any"]] = None) -> Flask:
     # Register routes
     _register_routes(app)
 
+    # Compile the URL map now instead of on the first request, so workers forked
+    # from a preloaded app share the compiled matcher instead of each building it
+    app.url_map.update()
+
     return app
 
 
@@ -57,22 +92,19 @@ def _configure_app(app: Flask, test_config: Optional[dict[str, "Any"]] = None) -
 
     """
     if test_config is None:
-        # Load configuration using the proper configuration system
-        from app.config import get_config
-
         try:
             # Get the appropriate configuration instance based on environment
             # This will also run comprehensive validation
             config_instance = get_config()
-            app.config.from_object(config_instance)
+            app.config.update(config_instance.as_dict())
 
             app.logger.info(
-                f"Loaded configuration: {config_instance.__class__.__name__}"
+                "Loaded configuration: %s", config_instance.__class__.__name__
             )
 
         except Exception as e:
             # Log configuration errors and re-raise
-            app.logger.error(f"Configuration validation failed: {e}")
+            app.logger.error("Configuration validation failed: %s", e)
             raise
     else:
         # Load the test config if passed in
@@ -87,13 +119,13 @@ def _init_extensions(app: Flask) -> None:
         app (Flask): The Flask application instance.
 
     """
-    from app.extensions import configure_extensions, init_extensions
+    extensions = _load("app.extensions")
 
     # Configure extension settings first
-    configure_extensions(app)
+    extensions.configure_extensions(app)
 
     # Initialize extensions with the app
-    init_extensions(app)
+    extensions.init_extensions(app)
 
 
 def _configure_logging(app: Flask) -> None:
@@ -103,9 +135,7 @@ def _configure_logging(app: Flask) -> None:
         app (Flask): The Flask application instance.
 
     """
-    from app.logging_config import configure_logging
-
-    configure_logging(app)
+    _load("app.logging_config").configure_logging(app)
 
 
 def _register_request_handlers(app: Flask) -> None:
@@ -115,102 +145,97 @@ def _register_request_handlers(app: Flask) -> None:
         app (Flask): The Flask application instance.
 
     """
-
-    @app.before_request
-    def log_request_start() -> None:  # pyright: ignore [reportUnusedFunction]
-        """Log the start of each request with basic information."""
-        # Get remote IP (handle X-Forwarded-For for proxy/load balancer)
-        remote_ip = request.environ.get("HTTP_X_FORWARDED_FOR", request.remote_addr)
-        user_agent = request.headers.get("User-Agent", "Unknown")
-
-        # Store start time for timing calculations
-        g.start_time = time.time()
-
-        # Log basic request information
-        app.logger.info(
-            "Request started: %s %s from IP %s (User-Agent: %s)",
-            request.method,
-            request.path,
-            remote_ip,
-            user_agent,
-        )
-
-        # Debug-level logging for development (excluding sensitive data)
-        if app.config.get("DEBUG") and app.logger.isEnabledFor(
-            app.logger.getEffectiveLevel()
+    # Path prefixes that are not access-logged (health checks, metrics, static
+    # files); normalized to a tuple once here so the per-request check is a
+    # single startswith. Test configurations that do not set them get the
+    # BaseConfig default.
+    skip_prefixes = app.config.setdefault(
+        "REQUEST_LOG_SKIP_PREFIXES", BaseConfig.REQUEST_LOG_SKIP_PREFIXES
+    )
+    app.config["REQUEST_LOG_SKIP_PREFIXES"] = tuple(skip_prefixes)
+
+    app.before_request(log_request_start)
+    app.after_request(log_request_end)
+
+
+def log_request_start() -> None:
+    """Record request timing and client details for the access log."""
+    skip_prefixes = current_app.config["REQUEST_LOG_SKIP_PREFIXES"]
+    if skip_prefixes and request.path.startswith(skip_prefixes):
+        g.skip_request_log = True
+        return
+
+    # Get remote IP (handle X-Forwarded-For for proxy/load balancer) once and
+    # share it with log_request_end and require_api_key through g
+    g.remote_ip = request.environ.get("HTTP_X_FORWARDED_FOR") or request.remote_addr
+
+    # Store start time for timing calculations (monotonic, immune to clock skew)
+    g.start_time_ns = time.monotonic_ns()
+
+    # Debug-level logging for development (excluding sensitive data); none of
+    # the debug payloads are built unless they will actually be emitted
+    if current_app.debug and _request_logger.isEnabledFor(logging.DEBUG):
+        # Log query parameters for GET requests (no sensitive data expected)
+        if request.method == "GET" and request.args:
+            # Filter out potentially sensitive parameters
+            safe_params = {
+                k: v
+                for k, v in request.args.items()
+                if k.lower() not in _SENSITIVE_PARAMS
+            }
+            if safe_params:
+                _request_logger.debug("Query parameters: %s", safe_params)
+
+        # Log request body size for POST/PUT (not content for security)
+        if request.method in ["POST", "PUT", "PATCH"] and hasattr(
+            request, "content_length"
         ):
-            # Log query parameters for GET requests (no sensitive data expected)
-            if request.method == "GET" and request.args:
-                # Filter out potentially sensitive parameters
-                safe_params = {
-                    k: v
-                    for k, v in request.args.items()
-                    if k.lower() not in ["api_key", "password", "token", "secret"]
-                }
-                if safe_params:
-                    app.logger.debug("Query parameters: %s", safe_params)
-
-            # Log request body size for POST/PUT (not content for security)
-            if request.method in ["POST", "PUT", "PATCH"] and hasattr(
-                request, "content_length"
-            ):
-                if request.content_length:
-                    app.logger.debug(
-                        "Request body size: %d bytes", request.content_length
-                    )
-
-    @app.after_request
-    def log_request_end(  # pyright: ignore[reportUnusedFunction]
-        response: Response,
-    ) -> Response:
-        """Log the completion of each request with response information.
-
-        Args:
-            response: The Flask response object.
-
-        Returns:
-            The unmodified response object.
-
-        """
-        # Get remote IP for consistency
-        remote_ip = request.environ.get("HTTP_X_FORWARDED_FOR", request.remote_addr)
-
-        # Calculate request duration
-        duration = None
-        if hasattr(g, "start_time"):
-            duration = time.time() - g.start_time
-
-        # Log response information
-        if duration is not None:
-            app.logger.info(
-                "Request completed: %s %s -> %d (%s) in %.3f seconds from IP %s",
-                request.method,
-                request.path,
-                response.status_code,
-                response.status,
-                duration,
-                remote_ip,
-            )
-        else:
-            app.logger.info(
-                "Request completed: %s %s -> %d (%s) from IP %s",
-                request.method,
-                request.path,
-                response.status_code,
-                response.status,
-                remote_ip,
-            )
+            if request.content_length:
+                _request_logger.debug(
+                    "Request body size: %d bytes", request.content_length
+                )
 
-        # Debug-level logging for response details
-        if app.config.get("DEBUG") and app.logger.isEnabledFor(
-            app.logger.getEffectiveLevel()
-        ):
-            # Log response size if available
-            if hasattr(response, "content_length") and response.content_length:
-                app.logger.debug("Response size: %d bytes", response.content_length)
 
+def log_request_end(response: Response) -> Response:
+    """Emit the single access log line for each completed request.
+
+    Args:
+        response: The Flask response object.
+
+    Returns:
+        The unmodified response object.
+
+    """
+    if g.get("skip_request_log"):
         return response
 
+    # Reuse the remote IP resolved in log_request_start
+    remote_ip = g.get("remote_ip")
+    user_agent = request.headers.get("User-Agent", "Unknown")
+
+    # Request duration in whole milliseconds; start_time_ns is always set by
+    # log_request_start, the fallback only guards against a missing hook
+    now_ns = time.monotonic_ns()
+    duration_ms = (now_ns - g.get("start_time_ns", now_ns)) // 1_000_000
+
+    _request_logger.info(
+        "Request completed: %s %s -> %d in %dms from IP %s (User-Agent: %s)",
+        request.method,
+        request.path,
+        response.status_code,
+        duration_ms,
+        remote_ip,
+        user_agent,
+    )
+
+    # Debug-level logging for response details
+    if current_app.debug and _request_logger.isEnabledFor(logging.DEBUG):
+        # Log response size if available
+        if hasattr(response, "content_length") and response.content_length:
+            _request_logger.debug("Response size: %d bytes", response.content_length)
+
+    return response
+
 
 def _register_error_handlers(app: Flask) -> None:
     """Register error handlers with the application.
@@ -219,9 +244,7 @@ def _register_error_handlers(app: Flask) -> None:
         app (Flask): The Flask application instance.
 
     """
-    from app.error_handlers import register_error_handlers
-
-    register_error_handlers(app)
+    _load("app.error_handlers").register_error_handlers(app)
 
 
 def _register_routes(app: Flask) -> None:
@@ -231,6 +254,4 @@ def _register_routes(app: Flask) -> None:
         app (Flask): The Flask application instance.
 
     """
-    from app.routes import register_routes
-
-    register_routes(app)
+    _load("app.routes").register_routes(app)
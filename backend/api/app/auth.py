@@ -3,16 +3,16 @@
 This module provides decorators and utilities for API key authentication.
 """
 
+import hmac
+import json
 import logging
-from datetime import datetime, timezone
 from functools import wraps
 from typing import Callable, TypeVar, Union
 
-from flask import Response, g, jsonify, request
+from flask import Response, g, request
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.extensions import db
-from app.models.api_client import ApiClient
 
 # Type variable for the decorated function
 F = TypeVar("F", bound=Callable[..., Union[Response, tuple[Response, int]]])
@@ -21,11 +21,37 @@ F = TypeVar("F", bound=Callable[..., Union[Response, tuple[Response, int]]])
 logger = logging.getLogger(__name__)
 
 
+def _error_body(error: str, message: str) -> bytes:
+    """Serialize an authentication error payload once, at import time."""
+    return json.dumps({"error": error, "message": message}).encode("utf-8")
+
+
+# Pre-serialized error bodies; a fresh Response is still built per request
+# because after_request handlers (e.g. CORS) add headers to it
+_MISSING_KEY_BODY = _error_body("Authentication failed", "API key is required")
+_INVALID_FORMAT_BODY = _error_body("Authentication failed", "Invalid API key format")
+_MALFORMED_KEY_BODY = _error_body("Authentication failed", "Malformed API key")
+_INVALID_KEY_BODY = _error_body("Authentication failed", "Invalid or inactive API key")
+_SERVICE_UNAVAILABLE_BODY = _error_body(
+    "Authentication service unavailable", "Please try again later"
+)
+
+# Compared against when no client matches, shaped like a real stored hash
+_DUMMY_API_KEY_HASH = "blake2b$" + "0" * 64
+
+
+def _error_response(body: bytes, status: int) -> Response:
+    """Build a JSON error response from a pre-serialized body."""
+    return Response(body, status=status, mimetype="application/json")
+
+
 def require_api_key(f: F) -> F:
     """Require API key for routes with enhanced error handling and logging.
 
     This decorator validates API keys using secure comparison methods,
-    logs authentication attempts, and updates usage statistics.
+    logs authentication attempts, and records usage statistics (written in
+    batches by app.usage_stats). Every request is verified against the
+    database, so deactivated clients and rotated keys are rejected at once.
 
     Args:
         f: The view function to decorate.
@@ -35,7 +61,8 @@ def require_api_key(f: F) -> F:
 
     Raises:
         Returns 401 for missing, invalid, or inactive API keys.
-        Returns 500 for database errors during authentication.
+        Returns 500 for database errors during authentication. Any other
+        exception propagates to the application's error handlers.
 
     """
 
@@ -43,8 +70,10 @@ def require_api_key(f: F) -> F:
     def decorated_function(
         *args: object, **kwargs: object
     ) -> Union[Response, tuple[Response, int], str]:
-        # Get remote IP for logging
-        remote_ip = request.environ.get("HTTP_X_FORWARDED_FOR", request.remote_addr)
+        # Get remote IP for logging (resolved once per request by log_request_start)
+        remote_ip = g.get("remote_ip") or (
+            request.environ.get("HTTP_X_FORWARDED_FOR") or request.remote_addr
+        )
 
         # Check for API key in header
         api_key_header = request.headers.get("X-API-Key")
@@ -52,117 +81,76 @@ def require_api_key(f: F) -> F:
             logger.warning(
                 "Authentication failed: Missing API key header from IP %s", remote_ip
             )
-            return (
-                jsonify(
-                    {"error": "Authentication failed", "message": "API key is required"}
-                ),
-                401,
-            )
+            return _error_response(_MISSING_KEY_BODY, 401)
 
         # Validate key format: <name>.<secret_key>
-        if "." not in api_key_header:
+        client_name, sep, secret_key = api_key_header.partition(".")
+        if not sep:
             logger.warning(
                 "Authentication failed: Invalid API key format from IP %s", remote_ip
             )
-            return (
-                jsonify(
-                    {
-                        "error": "Authentication failed",
-                        "message": "Invalid API key format",
-                    }
-                ),
-                401,
-            )
+            return _error_response(_INVALID_FORMAT_BODY, 401)
 
-        client_name, secret_key = api_key_header.split(".", 1)
         if not client_name or not secret_key:
             logger.warning(
                 "Authentication failed: Malformed API key from IP %s", remote_ip
             )
-            return (
-                jsonify(
-                    {
-                        "error": "Authentication failed",
-                        "message": "Malformed API key",
-                    }
-                ),
-                401,
-            )
+            return _error_response(_MALFORMED_KEY_BODY, 401)
+
+        # Imported on first authenticated request so that importing this module
+        # for the decorator alone does not load the models
+        from app.models.api_client import ApiClient, hash_api_key
+        from app.usage_stats import usage_stats
 
         try:
             # Find the client by name (public identifier)
             client = ApiClient.query.filter_by(name=client_name, is_active=True).first()
 
-            # Securely check the secret key
-            if not client or not client.check_api_key(secret_key):
+            # Securely check the secret key. Unknown clients still hash the key
+            # so they cannot be told apart from wrong keys by timing.
+            if client is None:
+                hmac.compare_digest(hash_api_key(secret_key), _DUMMY_API_KEY_HASH)
                 logger.warning(
                     "Authentication failed: Invalid API key for client '%s' from IP %s",
                     client_name,
                     remote_ip,
                 )
-                return (
-                    jsonify(
-                        {
-                            "error": "Authentication failed",
-                            "message": "Invalid or inactive API key",
-                        }
-                    ),
-                    401,
-                )
-
-            # Attach client to request context
-            g.api_client = client
-
-            # Update usage statistics
-            try:
-                client.last_used_at = datetime.now(timezone.utc)
-                client.use_count += 1
-                db.session.commit()
+                return _error_response(_INVALID_KEY_BODY, 401)
 
-                logger.info(
-                    "Authentication successful: Client '%s' from IP %s",
-                    client.name,
+            if not client.check_api_key(secret_key):
+                logger.warning(
+                    "Authentication failed: Invalid API key for client '%s' from IP %s",
+                    client_name,
                     remote_ip,
                 )
-            except SQLAlchemyError as e:
-                # Log the error but don't fail the request
-                logger.error(
-                    "Failed to update usage statistics for client '%s': %s",
-                    client.name,
-                    str(e),
-                )
-                db.session.rollback()
+                return _error_response(_INVALID_KEY_BODY, 401)
 
-            return f(*args, **kwargs)
+            # Upgrade legacy bcrypt hashes while the plaintext key is known
+            if client.needs_rehash:
+                client.set_api_key(secret_key)
+                db.session.commit()
+                logger.info("Rehashed API key for client '%s'", client.name)
 
         except SQLAlchemyError as e:
             logger.error(
                 "Database error during authentication from IP %s: %s", remote_ip, str(e)
             )
             db.session.rollback()
-            return (
-                jsonify(
-                    {
-                        "error": "Authentication service unavailable",
-                        "message": "Please try again later",
-                    }
-                ),
-                500,
-            )
-        except Exception as e:
-            logger.error(
-                "Unexpected error during authentication from IP %s: %s",
-                remote_ip,
-                str(e),
-            )
-            return (
-                jsonify(
-                    {
-                        "error": "Authentication service error",
-                        "message": "Please try again later",
-                    }
-                ),
-                500,
-            )
+            return _error_response(_SERVICE_UNAVAILABLE_BODY, 500)
+
+        # Attach client to request context
+        g.api_client = client
+
+        # Record usage; the buffered statistics are written in batches
+        usage_stats.record(client.id)
+
+        logger.info(
+            "Authentication successful: Client '%s' from IP %s",
+            client.name,
+            remote_ip,
+        )
+
+        # Errors raised by the view itself are left to the app's error handlers
+        return f(*args, **kwargs)
 
     return decorated_function  # pyright: ignore[reportReturnType]
@@ -5,12 +5,44 @@ testing, and production environments with appropriate validation.
 """
 
 import os
-from typing import Optional
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Optional
 
 from dotenv import load_dotenv
 
+from app.validators import ConfigurationError, validate_config
+
+# Set once the .env file has been processed. Child processes (e.g. the
+# reloader's) inherit the loaded variables, so they skip parsing it again.
+DOTENV_LOADED_VAR = "ERNESTO_DOTENV_LOADED"
+
+
+@lru_cache(maxsize=1)
+def load_env() -> bool:
+    """Load environment variables from the .env file once per process tree.
+
+    The application package, this module and the CLI scripts all need the
+    .env values; caching the call means the file is only located and parsed
+    the first time.
+
+    Returns:
+        bool: True if a .env file was found and loaded, False otherwise.
+
+    """
+    loaded = os.environ.get(DOTENV_LOADED_VAR)
+    if loaded is None:
+        loaded = os.environ[DOTENV_LOADED_VAR] = "1" if load_dotenv() else "0"
+    return loaded == "1"
+
+
 # Load environment variables from .env file
-load_dotenv()
+load_env()
+
+
+# Uppercase class-level settings per configuration class, collected on first use
+_CLASS_SETTINGS: dict[type, dict[str, Any]] = {}
 
 
 class BaseConfig:
@@ -27,26 +59,70 @@ class BaseConfig:
     API_TITLE: str = "Ernesto API"
     API_VERSION: str = "v1"
 
-    def __init__(self) -> None:
-        """Initialize configuration by reading environment variables at runtime."""
+    # CORS configuration - constants
+    CORS_METHODS: list[str] = ["GET", "POST", "PUT", "DELETE", "OPTIONS"]
+    CORS_HEADERS: list[str] = ["Content-Type", "X-API-Key"]
+    CORS_SUPPORTS_CREDENTIALS: bool = False  # API key auth doesn't need credentials
+
+    # Production log file; None writes logs/ernesto_api.log next to the
+    # instance folder
+    LOG_FILE: Optional[str] = None
+
+    # Request paths excluded from access logging
+    REQUEST_LOG_SKIP_PREFIXES: tuple[str, ...] = ("/healthz", "/metrics", "/static/")
+
+    # SECRET_KEY used when the environment does not set one (lowercase, so
+    # Flask's from_object does not copy it into app.config)
+    _secret_key_default: str = "dev-secret-key-change-in-production"
+
+    def __init__(self, env: Optional[Mapping[str, str]] = None) -> None:
+        """Initialize configuration by reading environment variables at runtime.
+
+        Args:
+            env (Mapping[str, str], optional): Environment to read settings from.
+                Defaults to os.environ; get_config passes an immutable snapshot.
+
+        """
+        env = os.environ if env is None else env
+
         # Security - runtime values only
-        self.SECRET_KEY: str = os.getenv(
-            "SECRET_KEY", "dev-secret-key-change-in-production"
-        )
+        self.SECRET_KEY: str = env.get("SECRET_KEY", self._secret_key_default)
+
+        # Server-side secret keying the API key hashes - runtime values only.
+        # Changing it invalidates every stored API key.
+        self.API_KEY_PEPPER: str = env.get("API_KEY_PEPPER", "")
 
         # Database - runtime values only
-        self.SQLALCHEMY_DATABASE_URI: str = os.getenv("DATABASE_URI", "")
+        self.SQLALCHEMY_DATABASE_URI: str = env.get("DATABASE_URI", "")
         self.SQLALCHEMY_TRACK_MODIFICATIONS: bool = (
-            os.getenv("SQLALCHEMY_TRACK_MODIFICATIONS", "False").lower() == "true"
+            env.get("SQLALCHEMY_TRACK_MODIFICATIONS", "False").lower() == "true"
         )
 
-        # CORS configuration - runtime values only
+        # CORS origins - per instance, subclasses fill them in
         self.CORS_ORIGINS: list[str] = []  # Empty list by default for security
-        self.CORS_METHODS: list[str] = ["GET", "POST", "PUT", "DELETE", "OPTIONS"]
-        self.CORS_HEADERS: list[str] = ["Content-Type", "X-API-Key"]
-        self.CORS_SUPPORTS_CREDENTIALS: bool = (
-            False  # API key auth doesn't need credentials
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the settings Flask's from_object would copy from this instance.
+
+        The class-level constants are collected with dir() once per class; only
+        the runtime values set in __init__ are read per call.
+
+        Returns:
+            dict[str, Any]: Uppercase setting names mapped to their values.
+
+        """
+        cls = type(self)
+        class_settings = _CLASS_SETTINGS.get(cls)
+        if class_settings is None:
+            class_settings = _CLASS_SETTINGS[cls] = {
+                key: getattr(cls, key) for key in dir(cls) if key.isupper()
+            }
+
+        settings = dict(class_settings)
+        settings.update(
+            (key, value) for key, value in vars(self).items() if key.isupper()
         )
+        return settings
 
 
 class DevelopmentConfig(BaseConfig):
@@ -56,12 +132,10 @@ class DevelopmentConfig(BaseConfig):
     DEBUG: bool = True
     LOG_LEVEL: str = "DEBUG"
 
-    def __init__(self) -> None:
+    def __init__(self, env: Optional[Mapping[str, str]] = None) -> None:
         """Initialize development configuration."""
-        super().__init__()
-
-        # Use environment DATABASE_URI - no hardcoded fallback
-        self.SQLALCHEMY_DATABASE_URI: str = os.getenv("DATABASE_URI", "")
+        # DATABASE_URI is read by BaseConfig - no hardcoded fallback
+        super().__init__(env)
 
         # CORS origins for development - allow localhost patterns
         self.CORS_ORIGINS: list[str] = [r"http://localhost:.*", r"http://127.0.0.1:.*"]
@@ -76,12 +150,13 @@ class TestingConfig(BaseConfig):
     LOG_LEVEL: str = "DEBUG"
     WTF_CSRF_ENABLED: bool = False  # Disable CSRF protection in testing
 
-    def __init__(self) -> None:
+    def __init__(self, env: Optional[Mapping[str, str]] = None) -> None:
         """Initialize testing configuration."""
-        super().__init__()
+        env = os.environ if env is None else env
+        super().__init__(env)
 
         # Use in-memory SQLite for testing by default
-        self.SQLALCHEMY_DATABASE_URI: str = os.getenv(
+        self.SQLALCHEMY_DATABASE_URI: str = env.get(
             "TEST_DATABASE_URI", "sqlite:///:memory:"
         )
 
@@ -92,28 +167,29 @@ class ProductionConfig(BaseConfig):
     # Override constants for production
     DEBUG: bool = False
     LOG_LEVEL: str = "ERROR"
+    JSONIFY_PRETTYPRINT_REGULAR: bool = False
     # Class-level attribute annotation to satisfy linters when overriding in __init__
     CORS_ORIGINS: list[str]
 
-    def __init__(self) -> None:
-        """Initialize production configuration."""
-        super().__init__()
-
-        # Ensure SECRET_KEY is set in production
-        self.SECRET_KEY: str = os.getenv("SECRET_KEY", "")
+    # Ensure SECRET_KEY is set in production (no development fallback)
+    _secret_key_default: str = ""
 
-        # Production database must be explicitly set
-        self.SQLALCHEMY_DATABASE_URI: str = os.getenv("DATABASE_URI", "")
+    def __init__(self, env: Optional[Mapping[str, str]] = None) -> None:
+        """Initialize production configuration."""
+        env = os.environ if env is None else env
+        # SECRET_KEY and DATABASE_URI are read once by BaseConfig; validate_config
+        # fails fast if either is missing
+        super().__init__(env)
 
         # Configure CORS origins for Chrome extension IDs if provided
-        chrome_extension_ids: str = os.getenv("CHROME_EXTENSION_IDS", "").strip()
+        # (strip, drop empty entries and build the origins in a single pass)
+        chrome_extension_ids: str = env.get("CHROME_EXTENSION_IDS", "")
         if chrome_extension_ids:
-            parsed_ids = [ext_id.strip() for ext_id in chrome_extension_ids.split(",")]
-            filtered_ids = [ext_id for ext_id in parsed_ids if ext_id]
-            if filtered_ids:
-                self.CORS_ORIGINS = [
-                    f"chrome-extension://{ext_id}" for ext_id in filtered_ids
-                ]
+            self.CORS_ORIGINS = [
+                f"chrome-extension://{ext_id}"
+                for ext_id in map(str.strip, chrome_extension_ids.split(","))
+                if ext_id
+            ]
 
 
 # Configuration mapping for environment-based selection
@@ -126,10 +202,67 @@ config_by_name = {
     "prod": ProductionConfig,
 }
 
+# Listed in the error raised for an unknown configuration name
+_AVAILABLE_CONFIGS = ", ".join(config_by_name)
+
+
+# Environment variables read by the configuration classes. get_config caches
+# configurations keyed on their values, so add any newly read variable here.
+_CONFIG_ENV_VARS = (
+    "SECRET_KEY",
+    "API_KEY_PEPPER",
+    "DATABASE_URI",
+    "SQLALCHEMY_TRACK_MODIFICATIONS",
+    "TEST_DATABASE_URI",
+    "CHROME_EXTENSION_IDS",
+)
+
+
+@lru_cache(maxsize=8)
+def _build_config(
+    config_class: type[BaseConfig], env_items: tuple[tuple[str, str], ...]
+) -> BaseConfig:
+    """Build and validate a configuration instance.
+
+    Cached, so validation runs once per configuration class and environment.
+
+    Args:
+        config_class (type[BaseConfig]): The configuration class to instantiate.
+        env_items (tuple): The (name, value) pairs of the set _CONFIG_ENV_VARS.
+
+    Returns:
+        BaseConfig: The validated configuration instance.
+
+    Raises:
+        ValueError: If the configuration fails validation.
+
+    """
+    config_instance = config_class(MappingProxyType(dict(env_items)))
+
+    try:
+        validate_config(config_instance)
+    except ConfigurationError as e:
+        # Re-raise as ValueError for backward compatibility with existing tests
+        raise ValueError(str(e)) from e
+
+    return config_instance
+
+
+def clear_config_cache() -> None:
+    """Forget all cached configuration instances.
+
+    The next get_config call builds and validates a fresh instance, e.g. after
+    a test has modified one that get_config returned.
+    """
+    _build_config.cache_clear()
+
 
 def get_config(config_name: Optional[str] = None) -> BaseConfig:
     """Get configuration instance based on environment name.
 
+    Instances are cached per configuration and environment values, so the
+    returned object is shared and must be treated as read-only.
+
     Args:
         config_name (str): Name of the configuration environment.
                           If None, uses FLASK_ENV environment variable.
@@ -142,28 +275,24 @@ def get_config(config_name: Optional[str] = None) -> BaseConfig:
         ValueError: If the configuration name is not recognized.
 
     """
+    # Bound once; every lookup below is a single os.environ.get call
+    get_env = os.environ.get
+
     if config_name is None:
-        config_name = os.getenv("FLASK_ENV", "development")
+        config_name = get_env("FLASK_ENV", "development")
 
-    config_class = config_by_name.get(config_name.lower())
+    # Names are almost always already lowercase; only fold case on a miss
+    config_class = config_by_name.get(config_name)
+    if config_class is None:
+        config_class = config_by_name.get(config_name.lower())
 
     if config_class is None:
-        available_configs = ", ".join(config_by_name.keys())
         raise ValueError(
             f"Unknown configuration '{config_name}'. "
-            + f"Available configurations: {available_configs}"
+            + f"Available configurations: {_AVAILABLE_CONFIGS}"
         )
 
-    # Create and validate configuration instance
-    config_instance = config_class()
-
-    # Import here to avoid circular imports
-    from app.validators import ConfigurationError, validate_config
-
-    try:
-        validate_config(config_instance)
-    except ConfigurationError as e:
-        # Re-raise as ValueError for backward compatibility with existing tests
-        raise ValueError(str(e)) from e
-
-    return config_instance
+    # Only the variables the configuration classes read make up the cache key
+    values = ((name, get_env(name)) for name in _CONFIG_ENV_VARS)
+    env_items = tuple((name, value) for name, value in values if value is not None)
+    return _build_config(config_class, env_items)
@@ -4,15 +4,72 @@ This module provides centralized error handling with consistent JSON responses
 and appropriate logging for debugging purposes.
 """
 
+import json
 from typing import TYPE_CHECKING, Union
 
-from flask import Response, jsonify, request
+from flask import Response, request
 from werkzeug.exceptions import HTTPException
 
 if TYPE_CHECKING:
     from flask import Flask
 
 
+def _error_body(error: str, message: str, status_code: int) -> bytes:
+    """Serialize an error payload.
+
+    Args:
+        error (str): Short error name.
+        message (str): Human-readable error description.
+        status_code (int): HTTP status code included in the payload.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON body.
+
+    """
+    return json.dumps(
+        {"error": error, "message": message, "status_code": status_code}
+    ).encode("utf-8")
+
+
+def _error_response(body: bytes, status: int) -> Response:
+    """Build a JSON error response from a serialized body.
+
+    A new Response is built per request because after_request handlers (e.g.
+    CORS) add headers to it; only the body is shared.
+
+    Args:
+        body (bytes): The serialized JSON body.
+        status (int): HTTP status code of the response.
+
+    Returns:
+        Response: The JSON error response.
+
+    """
+    return Response(body, status=status, mimetype="application/json")
+
+
+# Bodies of the static error responses, serialized once at import time
+_BAD_REQUEST_BODY = _error_body(
+    "Bad Request",
+    "The request could not be understood by the server due to malformed syntax.",
+    400,
+)
+_UNAUTHORIZED_BODY = _error_body(
+    "Unauthorized", "Authentication is required to access this resource.", 401
+)
+_FORBIDDEN_BODY = _error_body(
+    "Forbidden", "You do not have permission to access this resource.", 403
+)
+_NOT_FOUND_BODY = _error_body(
+    "Not Found", "The requested resource could not be found.", 404
+)
+_INTERNAL_SERVER_ERROR_BODY = _error_body(
+    "Internal Server Error",
+    "An unexpected error occurred. Please try again later.",
+    500,
+)
+
+
 def register_error_handlers(app: "Flask") -> None:
     """Register error handlers with the Flask application.
 
@@ -24,90 +81,55 @@ def register_error_handlers(app: "Flask") -> None:
     @app.errorhandler(400)
     def bad_request(  # pyright: ignore[reportUnusedFunction]
         error: Exception,  # pyright: ignore[reportUnusedParameter]
-    ) -> tuple[Response, int]:
+    ) -> Response:
         """Handle 400 Bad Request errors."""
-        app.logger.warning(f"Bad request from {request.remote_addr}: {request.url}")
-        return (
-            jsonify(
-                {
-                    "error": "Bad Request",
-                    "message": "The request could not be understood by the server due to malformed syntax.",
-                    "status_code": 400,
-                }
-            ),
-            400,
-        )
+        app.logger.warning("Bad request from %s: %s", request.remote_addr, request.url)
+        return _error_response(_BAD_REQUEST_BODY, 400)
 
     @app.errorhandler(401)
     def unauthorized(  # pyright: ignore[reportUnusedFunction]
         error: Exception,  # pyright: ignore[reportUnusedParameter]
-    ) -> tuple[Response, int]:
+    ) -> Response:
         """Handle 401 Unauthorized errors."""
         app.logger.warning(
-            f"Unauthorized access attempt from {request.remote_addr}: {request.url}"
-        )
-        return (
-            jsonify(
-                {
-                    "error": "Unauthorized",
-                    "message": "Authentication is required to access this resource.",
-                    "status_code": 401,
-                }
-            ),
-            401,
+            "Unauthorized access attempt from %s: %s", request.remote_addr, request.url
         )
+        return _error_response(_UNAUTHORIZED_BODY, 401)
 
     @app.errorhandler(403)
     def forbidden(  # pyright: ignore[reportUnusedFunction]
         error: Exception,  # pyright: ignore[reportUnusedParameter]
-    ) -> tuple[Response, int]:
+    ) -> Response:
         """Handle 403 Forbidden errors."""
         app.logger.warning(
-            f"Forbidden access attempt from {request.remote_addr}: {request.url}"
-        )
-        return (
-            jsonify(
-                {
-                    "error": "Forbidden",
-                    "message": "You do not have permission to access this resource.",
-                    "status_code": 403,
-                }
-            ),
-            403,
+            "Forbidden access attempt from %s: %s", request.remote_addr, request.url
         )
+        return _error_response(_FORBIDDEN_BODY, 403)
 
     @app.errorhandler(404)
     def not_found(  # pyright: ignore[reportUnusedFunction]
         error: Exception,  # pyright: ignore[reportUnusedParameter]
-    ) -> tuple[Response, int]:
+    ) -> Response:
         """Handle 404 Not Found errors."""
-        app.logger.info(f"404 error from {request.remote_addr}: {request.url}")
-        return (
-            jsonify(
-                {
-                    "error": "Not Found",
-                    "message": "The requested resource could not be found.",
-                    "status_code": 404,
-                }
-            ),
-            404,
-        )
+        app.logger.info("404 error from %s: %s", request.remote_addr, request.url)
+        return _error_response(_NOT_FOUND_BODY, 404)
 
     @app.errorhandler(405)
     def method_not_allowed(  # pyright: ignore[reportUnusedFunction]
         error: Exception,  # pyright: ignore[reportUnusedParameter]
-    ) -> tuple[Response, int]:
+    ) -> Response:
         """Handle 405 Method Not Allowed errors."""
         app.logger.warning(
-            f"Method not allowed from {request.remote_addr}: {request.method} {request.url}"
+            "Method not allowed from %s: %s %s",
+            request.remote_addr,
+            request.method,
+            request.url,
         )
-        return (
-            jsonify(
-                {
-                    "error": "Method Not Allowed",
-                    "message": f"The {request.method} method is not allowed for this resource.",
-                    "status_code": 405,
-                }
+        return _error_response(
+            _error_body(
+                "Method Not Allowed",
+                f"The {request.method} method is not allowed for this resource.",
+                405,
             ),
             405,
         )
@@ -115,42 +137,24 @@ def register_error_handlers(app: "Flask") -> None:
     @app.errorhandler(500)
     def internal_server_error(  # pyright: ignore[reportUnusedFunction]
         error: Exception,
-    ) -> tuple[Response, int]:
+    ) -> Response:
         """Handle 500 Internal Server Error."""
-        app.logger.error(f"Internal server error: {error}", exc_info=True)
-        return (
-            jsonify(
-                {
-                    "error": "Internal Server Error",
-                    "message": "An unexpected error occurred. Please try again later.",
-                    "status_code": 500,
-                }
-            ),
-            500,
-        )
+        app.logger.error("Internal server error: %s", error, exc_info=True)
+        return _error_response(_INTERNAL_SERVER_ERROR_BODY, 500)
 
     @app.errorhandler(Exception)
     def handle_unexpected_error(  # pyright: ignore[reportUnusedFunction]
         error: Exception,
-    ) -> Union[HTTPException, tuple[Response, int]]:
+    ) -> Union[HTTPException, Response]:
         """Handle any unexpected exceptions that aren't caught by specific handlers."""
         # If it's an HTTP exception, let the specific handler deal with it
         if isinstance(error, HTTPException):
             return error
 
         # Log the unexpected error with full traceback
-        app.logger.error(f"Unexpected error: {error}", exc_info=True)
+        app.logger.error("Unexpected error: %s", error, exc_info=True)
 
         # Return a generic 500 error response
-        return (
-            jsonify(
-                {
-                    "error": "Internal Server Error",
-                    "message": "An unexpected error occurred. Please try again later.",
-                    "status_code": 500,
-                }
-            ),
-            500,
-        )
+        return _error_response(_INTERNAL_SERVER_ERROR_BODY, 500)
 
     app.logger.info("Error handlers registered successfully")
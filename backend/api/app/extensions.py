@@ -5,12 +5,19 @@ Extensions are initialized here without being bound to any specific app instance
 following the application factory pattern best practices.
 """
 
-from typing import TYPE_CHECKING
+import re
+import sqlite3
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Union
 
+from flask.json.provider import DefaultJSONProvider
 from flask_alembic import Alembic
 from flask_cors import CORS
+from flask_cors.core import probably_regex
 from flask_marshmallow import Marshmallow
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 
 if TYPE_CHECKING:
     from flask import Flask
@@ -32,6 +39,53 @@ ma = Marshmallow()
 cors = CORS()
 
 
+@event.listens_for(Engine, "connect")
+def _enable_sqlite_foreign_keys(  # pyright: ignore[reportUnusedFunction]
+    dbapi_connection: object, _connection_record: object
+) -> None:
+    """Enforce foreign keys on SQLite connections.
+
+    SQLite ignores foreign key constraints, including ON DELETE CASCADE,
+    unless enabled per connection. Enabling them keeps development and test
+    databases consistent with PostgreSQL.
+    """
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+# Origins Flask-CORS recognises as "allow all" by their string value
+_CORS_WILDCARDS = frozenset({"*", ".*"})
+
+
+def compile_cors_origins(origins: Iterable[str]) -> list[Union[str, re.Pattern[str]]]:
+    """Compile regex CORS origins once so they are not re-parsed per request.
+
+    Flask-CORS matches string patterns with re.match on every request; compiled
+    patterns are used as-is. Origins are matched case-insensitively, as
+    Flask-CORS does for strings. Plain origins, the wildcards Flask-CORS
+    special-cases and invalid patterns are left as strings.
+
+    Args:
+        origins (Iterable[str]): The configured CORS_ORIGINS.
+
+    Returns:
+        list: Plain origins as strings and regex origins as compiled patterns.
+
+    """
+    compiled: list[Union[str, re.Pattern[str]]] = []
+    for origin in origins:
+        if origin in _CORS_WILDCARDS or not probably_regex(origin):
+            compiled.append(origin)
+            continue
+        try:
+            compiled.append(re.compile(origin, re.IGNORECASE))
+        except re.error:
+            compiled.append(origin)
+    return compiled
+
+
 def init_extensions(app: "Flask") -> None:
     """Initialize all Flask extensions with the given app instance.
 
@@ -49,7 +103,7 @@ def init_extensions(app: "Flask") -> None:
     # Initialize Flask-CORS with configuration from Flask config
     cors.init_app(
         app,
-        origins=app.config.get("CORS_ORIGINS", []),
+        origins=compile_cors_origins(app.config.get("CORS_ORIGINS", [])),
         methods=app.config.get(
             "CORS_METHODS", ["GET", "POST", "PUT", "DELETE", "OPTIONS"]
         ),
@@ -71,6 +125,12 @@ def init_extensions(app: "Flask") -> None:
     # Models will be discovered when imported by routes and other modules
     alembic.init_app(app)
 
+    # Initialize batched API client usage statistics
+    # Imported here because it depends on the models, which depend on db
+    from app.usage_stats import usage_stats
+
+    usage_stats.init_app(app)
+
 
 def configure_extensions(app: "Flask") -> None:
     """Configure extensions with app-specific settings.
@@ -90,3 +150,10 @@ def configure_extensions(app: "Flask") -> None:
     if not app.config.get("SQLALCHEMY_TRACK_MODIFICATIONS"):
         # Default to False for better performance
         app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+
+    # Flask 2.3+ no longer reads JSON_SORT_KEYS / JSONIFY_PRETTYPRINT_REGULAR, so
+    # apply them to the JSON provider: without this every response is
+    # key-sorted, and indented whenever debug is on
+    if isinstance(app.json, DefaultJSONProvider):
+        app.json.sort_keys = app.config.get("JSON_SORT_KEYS", False)
+        app.json.compact = not app.config.get("JSONIFY_PRETTYPRINT_REGULAR", False)
@@ -4,14 +4,61 @@ This module provides environment-specific logging configuration for development,
 testing, and production environments with appropriate handlers and formatters.
 """
 
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
-from typing import TYPE_CHECKING
+import queue
+import weakref
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from flask import Flask
 
+# app.extensions key of the background thread writing an application's
+# production log records to its file and console handlers, so request threads
+# only enqueue records and never block on disk I/O
+QUEUE_LISTENER_EXTENSION = "logging_queue_listener"
+
+# Applications with a running queue listener, for the exit and fork hooks
+_listening_apps: "weakref.WeakSet[Flask]" = weakref.WeakSet()
+
+
+def _stop_queue_listener(app: "Flask") -> None:
+    """Flush and stop an application's log listener, closing its handlers."""
+    _listening_apps.discard(app)
+    listener: Optional[QueueListener] = app.extensions.pop(
+        QUEUE_LISTENER_EXTENSION, None
+    )
+    if listener is None:
+        return
+
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def _stop_all_queue_listeners() -> None:
+    """Flush and stop the log listeners of every application."""
+    for app in list(_listening_apps):
+        _stop_queue_listener(app)
+
+
+def _restart_queue_listeners_after_fork() -> None:
+    """Start listener threads in a forked child (threads do not survive fork)."""
+    for app in list(_listening_apps):
+        listener: QueueListener = app.extensions[QUEUE_LISTENER_EXTENSION]
+        listener = app.extensions[QUEUE_LISTENER_EXTENSION] = QueueListener(
+            listener.queue, *listener.handlers, respect_handler_level=True
+        )
+        listener.start()
+
+
+# Write out any queued records when the process exits
+atexit.register(_stop_all_queue_listeners)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_queue_listeners_after_fork)
+
 
 def configure_logging(app: "Flask") -> None:
     """Configure logging for the Flask application based on the environment.
@@ -28,6 +75,7 @@ def configure_logging(app: "Flask") -> None:
     app.logger.setLevel(log_level)
 
     # Properly close and remove existing handlers to avoid resource leaks
+    _stop_queue_listener(app)
     for handler in app.logger.handlers[:]:
         handler.close()
         app.logger.removeHandler(handler)
@@ -74,14 +122,22 @@ def _configure_testing_logging(app: "Flask", log_level: int) -> None:
 
 
 def _configure_production_logging(app: "Flask", log_level: int) -> None:
-    """Configure logging for production environment."""
+    """Configure logging for production environment.
+
+    Records are handed to a QueueListener thread that writes them to a rotating
+    log file and, for errors, to the console.
+    """
+    # Default to logs/ernesto_api.log next to the instance folder
+    log_file = app.config.get("LOG_FILE") or os.path.join(
+        os.path.dirname(app.instance_path), "logs", "ernesto_api.log"
+    )
+
     # Ensure logs directory exists
-    logs_dir = os.path.join(os.path.dirname(app.instance_path), "logs")
+    logs_dir = os.path.dirname(log_file)
     if not os.path.exists(logs_dir):
         os.makedirs(logs_dir)
 
     # Create rotating file handler for production
-    log_file = os.path.join(logs_dir, "ernesto_api.log")
     file_handler = RotatingFileHandler(
         log_file,
         maxBytes=10 * 1024 * 1024,
@@ -96,8 +152,6 @@ def _configure_production_logging(app: "Flask", log_level: int) -> None:
     )
     file_handler.setFormatter(formatter)
 
-    app.logger.addHandler(file_handler)
-
     # Also add console handler for production (for container logs)
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.ERROR)  # Only errors to console in production
@@ -108,7 +162,16 @@ def _configure_production_logging(app: "Flask", log_level: int) -> None:
     )
     console_handler.setFormatter(console_formatter)
 
-    app.logger.addHandler(console_handler)
+    # Request threads only enqueue records; the listener thread does the writes
+    # (including rotation) and applies each handler's own level
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    app.logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    app.extensions[QUEUE_LISTENER_EXTENSION] = listener
+    _listening_apps.add(app)
 
 
 def _get_environment_name(app: "Flask") -> str:
@@ -0,0 +1,38 @@
+"""Add (topic_id, added_at) and (source_id, added_at) indexes to articles
+
+Revision ID: 1792162152
+Revises: 1749915703
+Create Date: 2026-10-16 09:29:12.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1792162152"
+down_revision: Union[str, None] = "1749915703"
+branch_labels: Union[str, Sequence[str], None] = ()
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_articles_topic_id_added_at",
+        "articles",
+        ["topic_id", sa.text("added_at DESC")],
+        unique=False,
+    )
+    op.create_index(
+        "ix_articles_source_id_added_at",
+        "articles",
+        ["source_id", sa.text("added_at DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_articles_source_id_added_at", table_name="articles")
+    op.drop_index("ix_articles_topic_id_added_at", table_name="articles")
@@ -0,0 +1,31 @@
+"""Add a check constraint rejecting dots in api_clients.name
+
+Revision ID: 1792170341
+Revises: 1792162152
+Create Date: 2026-10-16 11:45:41.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1792170341"
+down_revision: Union[str, None] = "1792162152"
+branch_labels: Union[str, Sequence[str], None] = ()
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Use batch mode for SQLite compatibility
+    with op.batch_alter_table("api_clients", schema=None) as batch_op:
+        batch_op.create_check_constraint(
+            "ck_api_clients_name_no_dot", "name NOT LIKE '%.%'"
+        )
+
+
+def downgrade() -> None:
+    # Use batch mode for SQLite compatibility
+    with op.batch_alter_table("api_clients", schema=None) as batch_op:
+        batch_op.drop_constraint("ck_api_clients_name_no_dot", type_="check")
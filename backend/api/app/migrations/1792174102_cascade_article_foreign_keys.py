@@ -0,0 +1,61 @@
+"""Cascade deletes from topics and sources to articles in the database
+
+Revision ID: 1792174102
+Revises: 1792170341
+Create Date: 2026-10-16 12:48:22.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1792174102"
+down_revision: Union[str, None] = "1792170341"
+branch_labels: Union[str, Sequence[str], None] = ()
+depends_on: Union[str, Sequence[str], None] = None
+
+# The foreign keys were created unnamed; this gives them PostgreSQL's default
+# names so that batch mode can drop them on SQLite as well
+naming_convention = {
+    "fk": "%(table_name)s_%(column_0_name)s_fkey",
+}
+
+
+def upgrade() -> None:
+    # Use batch mode for SQLite compatibility
+    with op.batch_alter_table(
+        "articles", schema=None, naming_convention=naming_convention
+    ) as batch_op:
+        batch_op.drop_constraint("articles_topic_id_fkey", type_="foreignkey")
+        batch_op.drop_constraint("articles_source_id_fkey", type_="foreignkey")
+        batch_op.create_foreign_key(
+            "articles_topic_id_fkey",
+            "topics",
+            ["topic_id"],
+            ["id"],
+            ondelete="CASCADE",
+        )
+        batch_op.create_foreign_key(
+            "articles_source_id_fkey",
+            "sources",
+            ["source_id"],
+            ["id"],
+            ondelete="CASCADE",
+        )
+
+
+def downgrade() -> None:
+    # Use batch mode for SQLite compatibility
+    with op.batch_alter_table(
+        "articles", schema=None, naming_convention=naming_convention
+    ) as batch_op:
+        batch_op.drop_constraint("articles_source_id_fkey", type_="foreignkey")
+        batch_op.drop_constraint("articles_topic_id_fkey", type_="foreignkey")
+        batch_op.create_foreign_key(
+            "articles_topic_id_fkey", "topics", ["topic_id"], ["id"]
+        )
+        batch_op.create_foreign_key(
+            "articles_source_id_fkey", "sources", ["source_id"], ["id"]
+        )
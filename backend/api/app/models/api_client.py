@@ -1,16 +1,71 @@
 """ApiClient model for storing API clients and their access tokens."""
 
+import hashlib
+import hmac
 import secrets
 from datetime import datetime
+from functools import lru_cache
 from typing import ClassVar, Optional
 
 import bcrypt
-from sqlalchemy import Boolean, DateTime, Integer, String, func
+from flask import current_app
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    DateTime,
+    Integer,
+    String,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, validates
 from typing_extensions import override
 
 from app.extensions import db
 
+# Prefix identifying API key hashes produced by the keyed BLAKE2b scheme
+API_KEY_HASH_PREFIX = "blake2b$"
+
+# Prefix shared by all bcrypt hashes, used before keyed BLAKE2b was adopted
+_BCRYPT_PREFIX = "$2"
+
+
+@lru_cache(maxsize=4)
+def _derive_hash_key(pepper: str) -> bytes:
+    """Derive a fixed-size BLAKE2b key from the API key pepper.
+
+    Args:
+        pepper: The server-side secret (may be empty).
+
+    Returns:
+        A 32-byte key, regardless of the pepper length.
+
+    """
+    return hashlib.blake2b(pepper.encode("utf-8"), digest_size=32).digest()
+
+
+def hash_api_key(api_key: str, pepper: Optional[str] = None) -> str:
+    """Hash an API key with keyed BLAKE2b.
+
+    Generated API keys carry 256 bits of entropy, so a fast keyed hash is as
+    resistant to brute force as bcrypt while costing microseconds instead of
+    milliseconds per check. The key is the API_KEY_PEPPER setting (required in
+    production), so a leaked table alone is not enough to test candidate keys.
+
+    Args:
+        api_key: The plaintext API key.
+        pepper: The hashing secret. Defaults to the current application's
+            API_KEY_PEPPER setting.
+
+    Returns:
+        The prefixed hexadecimal digest to store in hashed_api_key.
+
+    """
+    if pepper is None:
+        pepper = current_app.config.get("API_KEY_PEPPER", "")
+    key = _derive_hash_key(pepper)
+    digest = hashlib.blake2b(api_key.encode("utf-8"), key=key, digest_size=32)
+    return API_KEY_HASH_PREFIX + digest.hexdigest()
+
 
 class ApiClient(db.Model):
     """Model for storing API clients and their access tokens.
@@ -21,6 +76,10 @@ class ApiClient(db.Model):
     """
 
     __tablename__: ClassVar[str] = "api_clients"
+    # The dot separates the name from the secret in an API key header
+    __table_args__: ClassVar[tuple[CheckConstraint, ...]] = (
+        CheckConstraint("name NOT LIKE '%.%'", name="ck_api_clients_name_no_dot"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(
@@ -47,22 +106,18 @@ class ApiClient(db.Model):
         use_count: Optional[int] = None,
     ) -> None:
         """Create an ApiClient."""
-        kwargs = {}
-        if id is not None:
-            kwargs["id"] = id
-        if name is not None:
-            kwargs["name"] = name
-        if hashed_api_key is not None:
-            kwargs["hashed_api_key"] = hashed_api_key
-        if is_active is not None:
-            kwargs["is_active"] = is_active
-        if created_at is not None:
-            kwargs["created_at"] = created_at
-        if last_used_at is not None:
-            kwargs["last_used_at"] = last_used_at
-        if use_count is not None:
-            kwargs["use_count"] = use_count
-        super().__init__(**kwargs)
+        super().__init__()
+        for key, value in (
+            ("id", id),
+            ("name", name),
+            ("hashed_api_key", hashed_api_key),
+            ("is_active", is_active),
+            ("created_at", created_at),
+            ("last_used_at", last_used_at),
+            ("use_count", use_count),
+        ):
+            if value is not None:
+                setattr(self, key, value)
 
     @override
     def __repr__(self) -> str:
@@ -95,15 +150,28 @@ class ApiClient(db.Model):
 
     def set_api_key(self, api_key: str) -> None:
         """Hash and set the API key for the client."""
-        self.hashed_api_key = bcrypt.hashpw(
-            api_key.encode("utf-8"), bcrypt.gensalt()
-        ).decode("utf-8")
+        self.hashed_api_key = hash_api_key(api_key)
+
+    @property
+    def needs_rehash(self) -> bool:
+        """Whether the stored hash predates keyed BLAKE2b and should be upgraded.
+
+        The plaintext key is needed to rehash, so callers upgrade the hash
+        after a successful check_api_key.
+        """
+        return not self.hashed_api_key.startswith(API_KEY_HASH_PREFIX)
 
     def check_api_key(self, api_key: str) -> bool:
-        """Check if the provided API key matches the stored hash."""
-        return bcrypt.checkpw(
-            api_key.encode("utf-8"), self.hashed_api_key.encode("utf-8")
-        )
+        """Check if the provided API key matches the stored hash.
+
+        Hashes created before keyed BLAKE2b was adopted are bcrypt hashes and
+        are still verified with bcrypt.
+        """
+        if self.hashed_api_key.startswith(_BCRYPT_PREFIX):
+            return bcrypt.checkpw(
+                api_key.encode("utf-8"), self.hashed_api_key.encode("utf-8")
+            )
+        return hmac.compare_digest(hash_api_key(api_key), self.hashed_api_key)
 
     @classmethod
     def create_with_api_key(
@@ -1,15 +1,17 @@
 """Article model for storing news articles."""
 
 import uuid
+from collections.abc import Mapping, Sequence
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, ClassVar, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, insert
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing_extensions import override
 
 from app.extensions import db
+from app.models.ids import uuid7
 
 if TYPE_CHECKING:
     from app.models.source import Source
@@ -26,26 +28,36 @@ class Article(db.Model):
     __tablename__: ClassVar[str] = "articles"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     title: Mapped[str] = mapped_column(Text, nullable=False)
     url: Mapped[str] = mapped_column(String, nullable=False)
     image_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     brief: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     topic_id: Mapped[Optional[uuid.UUID]] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("topics.id"), nullable=True, index=True
+        UUID(as_uuid=True),
+        ForeignKey("topics.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
     )
     source_id: Mapped[Optional[uuid.UUID]] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("sources.id"), nullable=True, index=True
+        UUID(as_uuid=True),
+        ForeignKey("sources.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
     )
     added_at: Mapped[datetime] = mapped_column(
         DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
     )
 
     # Relationships
-    topic: Mapped[Optional["Topic"]] = relationship("Topic", back_populates="articles")
+    # Loaded with one extra SELECT per query rather than one per article, since
+    # ArticleSchema serializes both
+    topic: Mapped[Optional["Topic"]] = relationship(
+        "Topic", back_populates="articles", lazy="selectin"
+    )
     source: Mapped[Optional["Source"]] = relationship(
-        "Source", back_populates="articles"
+        "Source", back_populates="articles", lazy="selectin"
     )
 
     def __init__(
@@ -60,26 +72,42 @@ class Article(db.Model):
         added_at: Optional[datetime] = None,
     ) -> None:
         """Create an Article."""
-        kwargs = {}
-        if id is not None:
-            kwargs["id"] = id
-        if title is not None:
-            kwargs["title"] = title
-        if url is not None:
-            kwargs["url"] = url
-        if image_url is not None:
-            kwargs["image_url"] = image_url
-        if brief is not None:
-            kwargs["brief"] = brief
-        if topic_id is not None:
-            kwargs["topic_id"] = topic_id
-        if source_id is not None:
-            kwargs["source_id"] = source_id
-        if added_at is not None:
-            kwargs["added_at"] = added_at
-        super().__init__(**kwargs)
+        super().__init__()
+        for key, value in (
+            ("id", id),
+            ("title", title),
+            ("url", url),
+            ("image_url", image_url),
+            ("brief", brief),
+            ("topic_id", topic_id),
+            ("source_id", source_id),
+            ("added_at", added_at),
+        ):
+            if value is not None:
+                setattr(self, key, value)
 
     @override
     def __repr__(self) -> str:
         """Return string representation of the article."""
         return f"<Article {self.title[:30]}>"
+
+    @classmethod
+    def bulk_insert(cls, rows: Sequence[Mapping[str, Any]]) -> None:
+        """Insert many articles in one executemany INSERT.
+
+        Rows are not turned into Article instances, so this skips per-object
+        construction and unit-of-work bookkeeping. Column defaults (id,
+        added_at) are still applied. The caller commits the session.
+
+        Args:
+            rows: Column values for each article, keyed by attribute name.
+
+        """
+        if rows:
+            db.session.execute(insert(cls), list(rows))
+
+
+# Feed queries ("latest articles for a topic/source") filter on the foreign key
+# and order by added_at DESC; these indexes serve them without a sort step
+Index("ix_articles_topic_id_added_at", Article.topic_id, Article.added_at.desc())
+Index("ix_articles_source_id_added_at", Article.source_id, Article.added_at.desc())
@@ -1,17 +1,16 @@
 """Source model for storing news sources."""
 
 import uuid
-from typing import TYPE_CHECKING, ClassVar, Optional
+from typing import ClassVar, Optional
 
-from sqlalchemy import Boolean, String
+from sqlalchemy import Boolean, String, func, select
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 from typing_extensions import override
 
 from app.extensions import db
-
-if TYPE_CHECKING:
-    from app.models.article import Article
+from app.models.article import Article
+from app.models.ids import uuid7
 
 
 class Source(db.Model):
@@ -24,16 +23,28 @@ class Source(db.Model):
     __tablename__: ClassVar[str] = "sources"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     logo_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     homepage_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     is_enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
+    # Counted in SQL by the same SELECT that loads the row, so reading it
+    # neither loads the articles nor issues a query per object
+    article_count: Mapped[int] = column_property(
+        select(func.count(Article.id))
+        .where(Article.source_id == id)
+        .correlate_except(Article)
+        .scalar_subquery()
+    )
+
     # Relationships
     articles: Mapped[list["Article"]] = relationship(
-        "Article", back_populates="source", cascade="all, delete-orphan"
+        "Article",
+        back_populates="source",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __init__(
@@ -45,18 +56,16 @@ class Source(db.Model):
         is_enabled: Optional[bool] = None,
     ) -> None:
         """Create a Source."""
-        kwargs = {}
-        if id is not None:
-            kwargs["id"] = id
-        if logo_url is not None:
-            kwargs["logo_url"] = logo_url
-        if name is not None:
-            kwargs["name"] = name
-        if homepage_url is not None:
-            kwargs["homepage_url"] = homepage_url
-        if is_enabled is not None:
-            kwargs["is_enabled"] = is_enabled
-        super().__init__(**kwargs)
+        super().__init__()
+        for key, value in (
+            ("id", id),
+            ("logo_url", logo_url),
+            ("name", name),
+            ("homepage_url", homepage_url),
+            ("is_enabled", is_enabled),
+        ):
+            if value is not None:
+                setattr(self, key, value)
 
     @override
     def __repr__(self) -> str:
@@ -2,17 +2,16 @@
 
 import uuid
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, ClassVar, Optional
+from typing import ClassVar, Optional
 
-from sqlalchemy import DateTime, Integer, String
+from sqlalchemy import DateTime, Integer, String, func, select
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 from typing_extensions import override
 
 from app.extensions import db
-
-if TYPE_CHECKING:
-    from app.models.article import Article
+from app.models.article import Article
+from app.models.ids import uuid7
 
 
 class Topic(db.Model):
@@ -25,7 +24,7 @@ class Topic(db.Model):
     __tablename__: ClassVar[str] = "topics"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     label: Mapped[str] = mapped_column(String(255), nullable=False)
     added_at: Mapped[datetime] = mapped_column(
@@ -39,9 +38,21 @@ class Topic(db.Model):
     )
     coverage_score: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
+    # Counted in SQL by the same SELECT that loads the row, so reading it
+    # neither loads the articles nor issues a query per object
+    article_count: Mapped[int] = column_property(
+        select(func.count(Article.id))
+        .where(Article.topic_id == id)
+        .correlate_except(Article)
+        .scalar_subquery()
+    )
+
     # Relationships
     articles: Mapped[list["Article"]] = relationship(
-        "Article", back_populates="topic", cascade="all, delete-orphan"
+        "Article",
+        back_populates="topic",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __init__(
@@ -53,18 +64,16 @@ class Topic(db.Model):
         coverage_score: Optional[int] = None,
     ) -> None:
         """Create a Topic."""
-        kwargs = {}
-        if id is not None:
-            kwargs["id"] = id
-        if label is not None:
-            kwargs["label"] = label
-        if added_at is not None:
-            kwargs["added_at"] = added_at
-        if updated_at is not None:
-            kwargs["updated_at"] = updated_at
-        if coverage_score is not None:
-            kwargs["coverage_score"] = coverage_score
-        super().__init__(**kwargs)
+        super().__init__()
+        for key, value in (
+            ("id", id),
+            ("label", label),
+            ("added_at", added_at),
+            ("updated_at", updated_at),
+            ("coverage_score", coverage_score),
+        ):
+            if value is not None:
+                setattr(self, key, value)
 
     @override
     def __repr__(self) -> str:
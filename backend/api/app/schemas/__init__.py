@@ -4,11 +4,18 @@ This package contains all Marshmallow schemas organized in separate files.
 All schemas and schema instances are imported here for backward compatibility and convenience.
 """
 
+from functools import lru_cache
+
+from marshmallow import Schema
+
 from .article import ArticleSchema
-from .source import SourceSchema
-from .topic import TopicSchema
+from .source import SourceSchema, SourceWithArticlesSchema
+from .topic import TopicSchema, TopicWithArticlesSchema
 
-# Create schema instances for easy import (maintaining backward compatibility)
+# Create schema instances for easy import (maintaining backward compatibility).
+# Views should dump through these shared instances (or get_schema for other
+# options): constructing a schema deep copies and binds every declared field,
+# which is wasted work per request.
 source_schema = SourceSchema()
 sources_schema = SourceSchema(many=True)
 
@@ -18,10 +25,34 @@ topics_schema = TopicSchema(many=True)
 article_schema = ArticleSchema()
 articles_schema = ArticleSchema(many=True)
 
+
+@lru_cache(maxsize=128)
+def get_schema(
+    schema_cls: type[Schema], many: bool = False, exclude: tuple[str, ...] = ()
+) -> Schema:
+    """Return a shared schema instance for the given options.
+
+    Use this instead of constructing a schema with custom options in a view:
+    the instance is built once per (schema_cls, many, exclude) combination.
+
+    Args:
+        schema_cls (type[Schema]): The schema class to instantiate.
+        many (bool): Whether the schema serializes collections.
+        exclude (tuple[str, ...]): Field names to leave out.
+
+    Returns:
+        Schema: The cached schema instance.
+
+    """
+    return schema_cls(many=many, exclude=exclude)
+
+
 __all__ = [
     # Schema classes
     "SourceSchema",
+    "SourceWithArticlesSchema",
     "TopicSchema",
+    "TopicWithArticlesSchema",
     "ArticleSchema",
     # Schema instances
     "source_schema",
@@ -30,4 +61,6 @@ __all__ = [
     "topics_schema",
     "article_schema",
     "articles_schema",
+    # Cached schema factory
+    "get_schema",
 ]
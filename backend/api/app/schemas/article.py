@@ -1,7 +1,11 @@
 """Article schema for API serialization/deserialization."""
 
+import time
+from contextvars import ContextVar
+from typing import Optional
+
 from flask_sqlalchemy.session import Session
-from marshmallow import fields, post_dump
+from marshmallow import fields, pre_dump
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 from sqlalchemy.orm import scoped_session
 
@@ -10,6 +14,12 @@ from app.models.article import Article
 from app.schemas.source import SourceSchema
 from app.schemas.topic import TopicSchema
 
+_SECONDS_PER_DAY = 86400
+
+# Epoch time shared by all articles of the dump in progress. Kept in a context
+# variable because schema instances are shared across threads and requests.
+_dump_now: ContextVar[float] = ContextVar("article_dump_now")
+
 
 class ArticleSchema(SQLAlchemyAutoSchema):  # pyright: ignore[reportMissingTypeArgument]
     """Schema for Article model serialization/deserialization."""
@@ -20,7 +30,6 @@ class ArticleSchema(SQLAlchemyAutoSchema):  # pyright: ignore[reportMissingTypeA
         model: type[Article] = Article
         load_instance: bool = True
         sqla_session: scoped_session[Session] = db.session
-        include_relationships: bool = True
 
     # Explicitly define UUID fields to ensure proper serialization
     id: fields.UUID = fields.UUID(dump_only=True)
@@ -34,38 +43,34 @@ class ArticleSchema(SQLAlchemyAutoSchema):  # pyright: ignore[reportMissingTypeA
     url: fields.Url = fields.Url(required=True)
     image_url: fields.Url = fields.Url(allow_none=True)
 
-    # Nested schemas for relationships (exclude articles to avoid circular references)
-    topic: fields.Nested = fields.Nested(
-        TopicSchema, exclude=("articles",), dump_only=True
-    )
-    source: fields.Nested = fields.Nested(
-        SourceSchema, exclude=("articles",), dump_only=True
-    )
-
-    @post_dump
-    def add_computed_fields(
-        self, data: dict[str, object], **_kwargs: object
-    ) -> dict[str, object]:
-        """Add computed fields after serialization."""
-        # Add a computed field for article age in days
-        if "added_at" in data and data["added_at"]:
-            from datetime import datetime
-
-            try:
-                added_at_value = data["added_at"]
-                if isinstance(added_at_value, str):
-                    added_date = datetime.fromisoformat(
-                        added_at_value.replace("Z", "+00:00")
-                    )
-                    age_days = (
-                        datetime.now().replace(tzinfo=added_date.tzinfo) - added_date
-                    ).days
-                    data["age_days"] = age_days
-                else:
-                    data["age_days"] = None
-            except (ValueError, AttributeError):
-                data["age_days"] = None
-        else:
-            data["age_days"] = None
+    # Nested schemas for relationships (these do not nest articles back)
+    topic: fields.Nested = fields.Nested(TopicSchema, dump_only=True)
+    source: fields.Nested = fields.Nested(SourceSchema, dump_only=True)
 
+    # Whole days since the article was added, computed from the model's datetime
+    age_days: fields.Method = fields.Method("get_age_days", dump_only=True)
+
+    @pre_dump(pass_collection=True)
+    def capture_now(self, data: object, **_kwargs: object) -> object:
+        """Read the clock once per dump, shared by every article in it."""
+        _dump_now.set(time.time())
         return data
+
+    def get_age_days(self, article: Article) -> Optional[int]:
+        """Get the number of whole days since the article was added.
+
+        A naive added_at is read as server-local time, since that is what
+        datetime.timestamp() assumes for naive values; timezone-aware values
+        are converted exactly.
+
+        Args:
+            article (Article): The Article model instance.
+
+        Returns:
+            Optional[int]: Age in days, or None if added_at is not set.
+
+        """
+        added_at = article.added_at
+        if added_at is None:
+            return None
+        return int((_dump_now.get() - added_at.timestamp()) // _SECONDS_PER_DAY)
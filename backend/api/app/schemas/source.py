@@ -18,7 +18,6 @@ class SourceSchema(SQLAlchemyAutoSchema):  # pyright: ignore[reportMissingTypeAr
         model: type[Source] = Source
         load_instance: bool = True
         sqla_session: scoped_session[Session] = db.session
-        include_relationships: bool = True
 
     # Explicitly define UUID fields to ensure proper serialization
     id: fields.UUID = fields.UUID(dump_only=True)
@@ -27,24 +26,31 @@ class SourceSchema(SQLAlchemyAutoSchema):  # pyright: ignore[reportMissingTypeAr
     logo_url: fields.Url = fields.Url(allow_none=True)
     homepage_url: fields.Url = fields.Url(allow_none=True)
 
-    # Computed field: article count
+    # Article count, read from the model's COUNT column property
     article_count: fields.Method = fields.Method("get_article_count", dump_only=True)
 
-    # Nested articles (exclude to avoid circular references by default)
-    articles: fields.Nested = fields.Nested(
-        "ArticleSchema", many=True, exclude=("source",), dump_only=True
-    )
-
     def get_article_count(self, source: Source) -> int:
-        """Get the count of articles for this source.
+        """Get the number of articles of the source.
 
         Args:
             source (Source): The Source model instance.
 
         Returns:
-            int: Number of articles associated with this source.
+            int: The article count, or 0 if the source was not loaded from the
+                database (the count is only filled in by a query).
 
         """
-        if hasattr(source, "articles"):
-            return len(source.articles)
-        return 0
+        return source.article_count or 0
+
+
+class SourceWithArticlesSchema(SourceSchema):
+    """SourceSchema that also nests the source's articles.
+
+    Dumping the articles loads the whole collection, so only endpoints that
+    return it should use this schema.
+    """
+
+    # Nested articles (exclude source to avoid circular references)
+    articles: fields.Nested = fields.Nested(
+        "ArticleSchema", many=True, exclude=("source",), dump_only=True
+    )
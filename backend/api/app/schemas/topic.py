@@ -18,7 +18,6 @@ class TopicSchema(SQLAlchemyAutoSchema):  # pyright: ignore[reportMissingTypeArg
         model: type[Topic] = Topic
         load_instance: bool = True
         sqla_session: scoped_session[Session] = db.session
-        include_relationships: bool = True
 
     # Explicitly define UUID fields to ensure proper serialization
     id: fields.UUID = fields.UUID(dump_only=True)
@@ -32,24 +31,31 @@ class TopicSchema(SQLAlchemyAutoSchema):  # pyright: ignore[reportMissingTypeArg
         validate=validate.Range(min=0, max=100), load_default=0
     )
 
-    # Computed field: article count
+    # Article count, read from the model's COUNT column property
     article_count: fields.Method = fields.Method("get_article_count", dump_only=True)
 
-    # Nested articles (exclude to avoid circular references by default)
-    articles: fields.Nested = fields.Nested(
-        "ArticleSchema", many=True, exclude=("topic",), dump_only=True
-    )
-
     def get_article_count(self, topic: Topic) -> int:
-        """Get the count of articles for this topic.
+        """Get the number of articles of the topic.
 
         Args:
             topic (Topic): The Topic model instance.
 
         Returns:
-            int: Number of articles associated with this topic.
+            int: The article count, or 0 if the topic was not loaded from the
+                database (the count is only filled in by a query).
 
         """
-        if hasattr(topic, "articles"):
-            return len(topic.articles)
-        return 0
+        return topic.article_count or 0
+
+
+class TopicWithArticlesSchema(TopicSchema):
+    """TopicSchema that also nests the topic's articles.
+
+    Dumping the articles loads the whole collection, so only endpoints that
+    return it should use this schema.
+    """
+
+    # Nested articles (exclude topic to avoid circular references)
+    articles: fields.Nested = fields.Nested(
+        "ArticleSchema", many=True, exclude=("topic",), dump_only=True
+    )
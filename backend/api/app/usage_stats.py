@@ -0,0 +1,180 @@
+"""Batched usage statistics for authenticated API clients.
+
+Recording usage on every authenticated request used to mean one UPDATE and one
+commit per request. This module buffers the counts in memory per application
+and writes them in a single executemany UPDATE at most once every
+USAGE_STATS_FLUSH_INTERVAL seconds, and once more when the process exits.
+"""
+
+import atexit
+import logging
+import threading
+import time
+import weakref
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from flask import current_app
+from sqlalchemy import bindparam, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.extensions import db
+from app.models.api_client import ApiClient
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+# Default number of seconds between usage statistics flushes
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+logger = logging.getLogger(__name__)
+
+_api_clients = db.metadata.tables[ApiClient.__tablename__]
+
+# One parameter set per client: bump use_count by the buffered count and move
+# last_used_at to the most recent buffered use
+_UPDATE_USAGE = (
+    update(_api_clients)
+    .where(_api_clients.c.id == bindparam("client_id"))
+    .values(
+        use_count=_api_clients.c.use_count + bindparam("count"),
+        last_used_at=bindparam("used_at"),
+    )
+)
+
+
+def _write_usage(rows: list[dict[str, Any]]) -> None:
+    """Run the batched usage UPDATE in its own transaction.
+
+    A separate connection is used so that flushing never commits whatever the
+    current request has pending in db.session.
+
+    Args:
+        rows (list[dict[str, Any]]): One parameter set per client.
+
+    """
+    with db.engine.begin() as connection:
+        connection.execute(_UPDATE_USAGE, rows)
+
+
+class _UsageBuffer:
+    """Pending usage counts for a single application."""
+
+    def __init__(self) -> None:
+        """Create an empty buffer."""
+        self.lock: threading.Lock = threading.Lock()
+        # client_id -> (number of uses, timestamp of the latest use)
+        self.pending: dict[int, tuple[int, float]] = {}
+        self.last_flush: float = time.monotonic()
+
+
+class UsageStats:
+    """Flask extension that batches ApiClient usage statistics updates.
+
+    Flushing piggybacks on authenticated requests rather than a background
+    thread, so it keeps working in pre-forked WSGI workers.
+    """
+
+    def init_app(self, app: "Flask") -> None:
+        """Attach a usage buffer to the application.
+
+        Args:
+            app (Flask): The Flask application instance.
+
+        """
+        app.config.setdefault("USAGE_STATS_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL)
+        app.extensions["usage_stats"] = _UsageBuffer()
+        _apps.add(app)
+
+    def record(self, client_id: int) -> None:
+        """Record one use of a client, flushing the buffer if it is due.
+
+        Args:
+            client_id (int): The ID of the authenticated client.
+
+        """
+        buffer = self._get_buffer()
+        now = time.time()
+        with buffer.lock:
+            count, _ = buffer.pending.get(client_id, (0, now))
+            buffer.pending[client_id] = (count + 1, now)
+            elapsed = time.monotonic() - buffer.last_flush
+
+        if elapsed >= current_app.config["USAGE_STATS_FLUSH_INTERVAL"]:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write all buffered usage statistics to the database.
+
+        Database errors are logged and the counts are kept for the next flush,
+        so a failing update never fails the request that triggered it.
+
+        Returns:
+            int: Number of clients whose statistics were written.
+
+        """
+        buffer = self._get_buffer()
+        with buffer.lock:
+            pending, buffer.pending = buffer.pending, {}
+            buffer.last_flush = time.monotonic()
+
+        if not pending:
+            return 0
+
+        rows = [
+            {
+                "client_id": client_id,
+                "count": count,
+                "used_at": datetime.fromtimestamp(used_at, timezone.utc),
+            }
+            for client_id, (count, used_at) in pending.items()
+        ]
+
+        try:
+            _write_usage(rows)
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to update usage statistics for %d client(s): %s",
+                len(rows),
+                str(e),
+            )
+            self._requeue(buffer, pending)
+            return 0
+
+        return len(rows)
+
+    def _get_buffer(self) -> _UsageBuffer:
+        """Return the usage buffer of the current application."""
+        return current_app.extensions["usage_stats"]
+
+    @staticmethod
+    def _requeue(buffer: _UsageBuffer, pending: dict[int, tuple[int, float]]) -> None:
+        """Merge counts from a failed flush back into the buffer."""
+        with buffer.lock:
+            for client_id, (count, used_at) in pending.items():
+                queued_count, queued_at = buffer.pending.get(client_id, (0, used_at))
+                buffer.pending[client_id] = (
+                    queued_count + count,
+                    max(queued_at, used_at),
+                )
+
+
+# Shared extension instance, initialized by app.extensions.init_extensions
+usage_stats = UsageStats()
+
+# Applications with a usage buffer, flushed by the exit hook
+_apps: "weakref.WeakSet[Flask]" = weakref.WeakSet()
+
+
+def _flush_all_at_exit() -> None:
+    """Write the counts every application buffered since its last flush.
+
+    Flushes are otherwise triggered by authenticated requests, so without this
+    the counts of an idle or restarting worker would be lost.
+    """
+    for app in list(_apps):
+        with app.app_context():
+            usage_stats.flush()
+
+
+atexit.register(_flush_all_at_exit)
@@ -7,11 +7,37 @@ and environment-specific validation requirements.
 
 import re
 from typing import TYPE_CHECKING, Optional
-from urllib.parse import urlparse
 
 if TYPE_CHECKING:
     from app.config import BaseConfig
 
+# Scheme and host of a database URI. The user info is matched possessively so
+# that "user:pass@/db" has no host, the same as urlparse's hostname
+_DATABASE_URI_RE = re.compile(
+    r"^(?P<scheme>[A-Za-z][A-Za-z0-9+.\-]*):"
+    r"(?://(?:[^/?#]*@)?+(?P<host>\[[^\]/?#]+\]|[^/?#:@\[\]]+)(?=[:/?#]|$))?"
+)
+
+# Log levels accepted for LOG_LEVEL, in the order listed in error messages
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VALID_LOG_LEVELS = frozenset(_LOG_LEVELS)
+
+# Secret keys flagged as weak (compared case-insensitively)
+_WEAK_SECRETS = frozenset({"secret", "password"})
+
+# Production CORS origins must be chrome-extension://<32 a-p chars>
+_CHROME_EXTENSION_SCHEME = "chrome-extension://"
+_CHROME_EXTENSION_ID_RE = re.compile(r"^[a-p]{32}$")
+_PRODUCTION_CORS_HEADERS = frozenset({"Content-Type", "X-API-Key"})
+
+# Development origins accepted without a warning (regex or literal localhost)
+_LOCALHOST_ORIGIN_RES = (
+    re.compile(r"^r?http://localhost:.*$"),
+    re.compile(r"^r?http://127\.0\.0\.1:.*$"),
+    re.compile(r"^r?https://localhost:.*$"),
+    re.compile(r"^r?https://127\.0\.0\.1:.*$"),
+)
+
 
 class ConfigurationError(Exception):
     """Raised when configuration validation fails."""
@@ -46,10 +72,17 @@ class ConfigValidator:
         self.config: "BaseConfig" = config
         self.errors: list[str] = []
         self.warnings: list[str] = []
+        # Environment flags consulted by most checks, read once up front
+        self._debug: bool = bool(getattr(config, "DEBUG", False))
+        self._testing: bool = bool(getattr(config, "TESTING", False))
 
-    def validate_all(self) -> None:
+    def validate_all(self, fail_fast: bool = False) -> None:
         """Perform comprehensive validation of all configuration parameters.
 
+        Args:
+            fail_fast (bool): Stop after the first check that reports an error
+                instead of collecting errors from every check.
+
         Raises:
             ConfigurationError: If any validation checks fail.
 
@@ -59,12 +92,17 @@ class ConfigValidator:
         self.warnings = []
 
         # Run all validation methods
-        self.validate_required_fields()
-        self.validate_database_config()
-        self.validate_security_config()
-        self.validate_application_config()
-        self.validate_cors_config()
-        self.validate_environment_specific()
+        for check in (
+            self.validate_required_fields,
+            self.validate_database_config,
+            self.validate_security_config,
+            self.validate_application_config,
+            self.validate_cors_config,
+            self.validate_environment_specific,
+        ):
+            check()
+            if fail_fast and self.errors:
+                break
 
         # Raise error if any validation failed
         if self.errors:
@@ -115,7 +153,7 @@ class ConfigValidator:
         track_modifications = getattr(
             self.config, "SQLALCHEMY_TRACK_MODIFICATIONS", True
         )
-        if track_modifications and not getattr(self.config, "DEBUG", False):
+        if track_modifications and not self._debug:
             self.warnings.append(
                 "SQLALCHEMY_TRACK_MODIFICATIONS should be False in production for better performance"
             )
@@ -127,12 +165,8 @@ class ConfigValidator:
         if secret_key:
             self._validate_secret_key_strength(secret_key)
 
-        # Validate debug mode in production
-        debug = getattr(self.config, "DEBUG", False)
-        testing = getattr(self.config, "TESTING", False)
-
         # Check if we're in production (not debug and not testing)
-        if not debug and not testing:
+        if not self._debug and not self._testing:
             # Production environment checks
             if secret_key and len(secret_key) < 32:
                 self.errors.append(
@@ -143,10 +177,9 @@ class ConfigValidator:
         """Validate general application configuration parameters."""
         # Validate log level
         log_level = getattr(self.config, "LOG_LEVEL", "INFO")
-        valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if log_level not in valid_log_levels:
+        if log_level not in _VALID_LOG_LEVELS:
             self.errors.append(
-                f"Invalid log level: {log_level}. Valid options: {', '.join(valid_log_levels)}"
+                f"Invalid log level: {log_level}. Valid options: {', '.join(_LOG_LEVELS)}"
             )
 
         # Validate API metadata
@@ -168,10 +201,7 @@ class ConfigValidator:
         cors_headers = getattr(self.config, "CORS_HEADERS", []) or []
         supports_credentials = getattr(self.config, "CORS_SUPPORTS_CREDENTIALS", False)
 
-        debug = getattr(self.config, "DEBUG", False)
-        testing = getattr(self.config, "TESTING", False)
-
-        is_production = not debug and not testing
+        is_production = not self._debug and not self._testing
 
         # OPTIONS must be supported everywhere for preflight
         if "OPTIONS" not in cors_methods:
@@ -202,22 +232,20 @@ class ConfigValidator:
                 self.errors.append("CORS_ORIGINS cannot be empty in production")
             else:
                 # Only allow chrome-extension scheme with valid extension IDs
-                chrome_scheme = "chrome-extension://"
-                id_pattern = re.compile(r"^[a-p]{32}$")
                 for origin in cors_origins:
                     if not isinstance(origin, str):
                         self.errors.append(
                             f"Invalid production CORS origin type: {origin!r}"
                         )
                         continue
-                    if not origin.startswith(chrome_scheme):
+                    if not origin.startswith(_CHROME_EXTENSION_SCHEME):
                         self.errors.append(
                             f"Invalid production CORS origin: {origin}. "
                             + "Only chrome-extension://<32 a-p chars> allowed"
                         )
                         continue
-                    ext_id = origin[len(chrome_scheme) :]
-                    if not id_pattern.match(ext_id):
+                    ext_id = origin[len(_CHROME_EXTENSION_SCHEME) :]
+                    if not _CHROME_EXTENSION_ID_RE.match(ext_id):
                         self.errors.append(
                             f"Invalid Chrome extension ID in origin: {origin}"
                         )
@@ -229,29 +257,23 @@ class ConfigValidator:
                 )
 
             # Restrict allowed headers
-            allowed_headers = {"Content-Type", "X-API-Key"}
-            extra_headers = [h for h in cors_headers if h not in allowed_headers]
+            extra_headers = [
+                h for h in cors_headers if h not in _PRODUCTION_CORS_HEADERS
+            ]
             if extra_headers:
                 self.errors.append(
                     "CORS_HEADERS must only include: Content-Type, X-API-Key"
                 )
         else:
             # Development: warn if non-localhost/non-regex localhost are used
-            if debug and cors_origins:
-                # Accept regex or literal localhost/127.0.0.1 schemes
-                localhost_ok_patterns = [
-                    re.compile(r"^r?http://localhost:.*$"),
-                    re.compile(r"^r?http://127\.0\.0\.1:.*$"),
-                    re.compile(r"^r?https://localhost:.*$"),
-                    re.compile(r"^r?https://127\.0\.0\.1:.*$"),
-                ]
+            if self._debug and cors_origins:
                 for origin in cors_origins:
                     if not isinstance(origin, str):
                         self.warnings.append(
                             f"Unexpected CORS origin type in development: {origin!r}"
                         )
                         continue
-                    if any(p.match(origin) for p in localhost_ok_patterns):
+                    if any(p.match(origin) for p in _LOCALHOST_ORIGIN_RES):
                         continue
                     self.warnings.append(
                         f"Non-localhost CORS origin in development: {origin}"
@@ -259,13 +281,10 @@ class ConfigValidator:
 
     def validate_environment_specific(self) -> None:
         """Validate environment-specific configuration requirements."""
-        debug = getattr(self.config, "DEBUG", False)
-        testing = getattr(self.config, "TESTING", False)
-
-        if testing:
+        if self._testing:
             # Testing environment validations
             self._validate_testing_environment()
-        elif debug:
+        elif self._debug:
             # Development environment validations
             self._validate_development_environment()
         else:
@@ -282,14 +301,9 @@ class ConfigValidator:
             bool: True if the URI format is valid, False otherwise.
 
         """
-        try:
-            parsed = urlparse(uri)
-            # Check for required components
-            return bool(
-                parsed.scheme and (parsed.hostname or uri.startswith("sqlite:"))
-            )
-        except Exception:
-            return False
+        # A scheme is required, plus a host unless it is a SQLite file URI
+        match = _DATABASE_URI_RE.match(uri)
+        return bool(match and (match["host"] or match["scheme"] == "sqlite"))
 
     def _validate_secret_key_strength(self, secret: str) -> None:
         """Validate Flask SECRET_KEY strength.
@@ -302,12 +316,8 @@ class ConfigValidator:
             self.errors.append("SECRET_KEY must be at least 16 characters long")
 
         # Check for default/weak secrets
-        weak_secrets = [
-            "secret",
-            "password",
-        ]
-        if secret.lower() in weak_secrets:
-            if getattr(self.config, "DEBUG", False):
+        if secret.lower() in _WEAK_SECRETS:
+            if self._debug:
                 self.warnings.append(
                     "Using weak SECRET_KEY in development. "
                     + "Consider using a stronger secret for better security."
@@ -317,9 +327,7 @@ class ConfigValidator:
                     "Weak SECRET_KEY detected. Use a strong, random secret in production."
                 )
         # Warn about the default development secret in development
-        elif secret == "dev-secret-key-change-in-production" and getattr(
-            self.config, "DEBUG", False
-        ):
+        elif secret == "dev-secret-key-change-in-production" and self._debug:
             self.warnings.append(
                 "Using default SECRET_KEY in development. "
                 + "Consider using a stronger secret for better security."
@@ -354,12 +362,10 @@ class ConfigValidator:
     def _validate_production_environment(self) -> None:
         """Validate production environment configuration."""
         # Production-specific validations
-        debug = getattr(self.config, "DEBUG", False)
-        if debug:
+        if self._debug:
             self.errors.append("DEBUG must be False in production")
 
-        testing = getattr(self.config, "TESTING", False)
-        if testing:
+        if self._testing:
             self.errors.append("TESTING must be False in production")
 
         # Check for missing required configuration values in production
@@ -367,16 +373,21 @@ class ConfigValidator:
 
         secret_key = getattr(self.config, "SECRET_KEY", None)
         database_uri = getattr(self.config, "SQLALCHEMY_DATABASE_URI", None)
+        api_key_pepper = getattr(self.config, "API_KEY_PEPPER", None)
 
         if not secret_key:
             missing_vars.append("SECRET_KEY")
         if not database_uri:
             missing_vars.append("DATABASE_URI")
+        if not api_key_pepper:
+            missing_vars.append("API_KEY_PEPPER")
 
         if missing_vars:
-            # Use the original error message format expected by tests
-            raise ValueError(
-                f"Missing required environment variables for production: {', '.join(missing_vars)}"
+            # Stop at the first missing variable set so startup fails fast with
+            # the variable names; get_config re-raises this as ValueError
+            raise ConfigurationError(
+                f"Missing required environment variables for production: {', '.join(missing_vars)}",
+                missing_vars=missing_vars,
             )
 
         # Check database security
@@ -386,7 +397,7 @@ class ConfigValidator:
             )
 
 
-def validate_config(config: "BaseConfig") -> None:
+def validate_config(config: "BaseConfig", fail_fast: bool = False) -> None:
     """Validate configuration using the ConfigValidator.
 
     This is a convenience function that creates a ConfigValidator instance
@@ -394,10 +405,11 @@ def validate_config(config: "BaseConfig") -> None:
 
     Args:
         config (BaseConfig): The configuration object to validate.
+        fail_fast (bool): Stop at the first check that reports an error.
 
     Raises:
         ConfigurationError: If any validation checks fail.
 
     """
     validator = ConfigValidator(config)
-    validator.validate_all()
+    validator.validate_all(fail_fast=fail_fast)
@@ -6,9 +6,8 @@ Usage: python generate_api_key.py <client_name>
 
 import sys
 
-from dotenv import load_dotenv
-
 from app import create_app
+from app.config import load_env
 from app.extensions import db
 from app.models.api_client import ApiClient
 
@@ -54,7 +53,7 @@ def generate_key(client_name: str) -> int:
 def main() -> int:
     """Generate API key for the specified client."""
     # Load environment variables
-    load_dotenv()
+    load_env()
 
     # Check arguments
     if len(sys.argv) != 2:
@@ -8,12 +8,13 @@ import re
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
+import bcrypt
 import pytest
-from sqlalchemy import inspect
+from sqlalchemy import insert, inspect
 from sqlalchemy.exc import IntegrityError
 
 from app.extensions import db
-from app.models.api_client import ApiClient
+from app.models.api_client import API_KEY_HASH_PREFIX, ApiClient, hash_api_key
 
 if TYPE_CHECKING:
     from flask import Flask
@@ -55,7 +56,7 @@ class TestApiClient:
         # Check for URL-safe characters
         assert re.match(r"^[A-Za-z0-9_-]+$", key_32)
 
-    def test_set_and_check_api_key(self) -> None:
+    def test_set_and_check_api_key(self, app: "Flask") -> None:
         """Test setting and checking the API key."""
         api_client = ApiClient(name="key_test_client")
         api_key = ApiClient.generate_api_key()
@@ -66,7 +67,53 @@ class TestApiClient:
         assert api_client.check_api_key(api_key) is True
         assert api_client.check_api_key("not_the_key") is False
 
-    def test_create_with_api_key(self) -> None:
+    def test_api_key_hash_uses_keyed_blake2b(self, app: "Flask") -> None:
+        """Test that new API keys are stored as keyed BLAKE2b digests."""
+        api_client = ApiClient(name="blake2b_client")
+        api_client.set_api_key("secret-key")
+
+        assert api_client.hashed_api_key.startswith(API_KEY_HASH_PREFIX)
+        assert len(api_client.hashed_api_key) <= 128
+        assert api_client.hashed_api_key == hash_api_key("secret-key")
+
+    def test_api_key_hash_depends_on_pepper(self) -> None:
+        """Test that changing the pepper changes the stored digest."""
+        first = hash_api_key("secret-key", pepper="pepper-one")
+        second = hash_api_key("secret-key", pepper="pepper-two")
+
+        assert first != second
+
+    def test_api_key_hash_reads_pepper_from_app_config(self, app: "Flask") -> None:
+        """Test that hashing uses the application's API_KEY_PEPPER setting."""
+        app.config["API_KEY_PEPPER"] = "configured-pepper"
+
+        assert hash_api_key("secret-key") == hash_api_key(
+            "secret-key", pepper="configured-pepper"
+        )
+        assert hash_api_key("secret-key") != hash_api_key("secret-key", pepper="")
+
+    def test_check_legacy_bcrypt_api_key(self) -> None:
+        """Test that API keys hashed with bcrypt are still accepted."""
+        api_client = ApiClient(name="legacy_client")
+        api_client.hashed_api_key = bcrypt.hashpw(
+            b"legacy-key", bcrypt.gensalt(rounds=4)
+        ).decode("utf-8")
+
+        assert api_client.check_api_key("legacy-key") is True
+        assert api_client.check_api_key("not_the_key") is False
+
+    def test_needs_rehash(self, app: "Flask") -> None:
+        """Test that only legacy bcrypt hashes are flagged for rehashing."""
+        api_client = ApiClient(name="rehash_client")
+        api_client.hashed_api_key = bcrypt.hashpw(
+            b"legacy-key", bcrypt.gensalt(rounds=4)
+        ).decode("utf-8")
+        assert api_client.needs_rehash is True
+
+        api_client.set_api_key("legacy-key")
+        assert api_client.needs_rehash is False
+
+    def test_create_with_api_key(self, app: "Flask") -> None:
         """Test the class method for creating a client with an API key."""
         api_client, api_key = ApiClient.create_with_api_key(name="factory_client")
         assert isinstance(api_client, ApiClient)
@@ -90,6 +137,17 @@ class TestApiClient:
             with pytest.raises(ValueError, match="Client name cannot contain a dot"):
                 client.name = "invalid.name"
 
+    def test_api_client_name_check_constraint_rejects_dots(self, app: "Flask") -> None:
+        """Test that the database rejects dotted names that bypass the validator."""
+        with app.app_context():
+            with pytest.raises(IntegrityError):
+                db.session.execute(
+                    insert(ApiClient).values(
+                        name="client.with.dots", hashed_api_key="some_key"
+                    )
+                )
+            db.session.rollback()
+
     def test_api_client_name_validation_accepts_valid_names(self, app: "Flask") -> None:
         """Test that valid client names without dots are accepted."""
         with app.app_context():
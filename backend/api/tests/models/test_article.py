@@ -137,6 +137,29 @@ class TestArticle:
             remaining_articles = Article.query.all()
             assert len(remaining_articles) == 0
 
+    def test_article_cascade_deletion_does_not_load_articles(
+        self, app: "Flask"
+    ) -> None:
+        """Test that deleting a topic leaves removing its articles to the database."""
+        with app.app_context():
+            topic = Topic(label="Passive Delete Topic")
+            db.session.add(topic)
+            db.session.commit()
+            db.session.add(
+                Article(
+                    title="Test Article",
+                    url="https://example.com/test",
+                    topic_id=topic.id,
+                )
+            )
+            db.session.commit()
+
+            db.session.delete(topic)
+            db.session.commit()
+
+            assert "articles" not in topic.__dict__
+            assert Article.query.count() == 0
+
     def test_article_foreign_key_relationships(self, app: "Flask") -> None:
         """Test that Article foreign key relationships are properly defined."""
         with app.app_context():
@@ -300,6 +323,34 @@ class TestArticle:
             assert len(source.articles) == 100
             assert len(topic.articles) == 100
 
+    def test_article_bulk_insert(self, app: "Flask") -> None:
+        """Test that bulk_insert stores rows and applies column defaults."""
+        with app.app_context():
+            source = Source(name="Bulk Insert Source")
+            topic = Topic(label="Bulk Insert Topic")
+            db.session.add_all([source, topic])
+            db.session.commit()
+
+            Article.bulk_insert(
+                [
+                    {
+                        "title": f"Bulk Insert Article {i}",
+                        "url": f"https://example.com/bulk-insert/{i}",
+                        "topic_id": topic.id,
+                        "source_id": source.id,
+                    }
+                    for i in range(100)
+                ]
+            )
+            Article.bulk_insert([])
+            db.session.commit()
+
+            articles = Article.query.all()
+            assert len(articles) == 100
+            assert len({article.id for article in articles}) == 100
+            assert all(isinstance(article.added_at, datetime) for article in articles)
+            assert len(topic.articles) == 100
+
     def test_article_query_performance(self, app: "Flask") -> None:
         """Test basic query performance for Article."""
         with app.app_context():
@@ -0,0 +1,35 @@
+"""Tests for primary key generation."""
+
+import time
+import uuid
+
+from app.models.ids import uuid7
+
+
+class TestUuid7:
+    """Test the time-ordered UUID generator."""
+
+    def test_uuid7_version_and_variant(self) -> None:
+        """Test that generated UUIDs are RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+        assert isinstance(value, uuid.UUID)
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_uuid7_embeds_current_time(self) -> None:
+        """Test that the leading 48 bits hold the Unix time in milliseconds."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= value.int >> 80 <= after
+
+    def test_uuid7_is_time_ordered(self) -> None:
+        """Test that UUIDs generated in later milliseconds sort after earlier ones."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        assert first < second
+
+    def test_uuid7_is_unique(self) -> None:
+        """Test that UUIDs generated within the same millisecond do not collide."""
+        assert len({uuid7() for _ in range(1000)}) == 1000
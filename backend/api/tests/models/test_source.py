@@ -11,6 +11,7 @@ from sqlalchemy import inspect
 from sqlalchemy.exc import IntegrityError
 
 from app.extensions import db
+from app.models.article import Article
 from app.models.source import Source
 
 if TYPE_CHECKING:
@@ -51,6 +52,25 @@ class TestSource:
             assert source.is_enabled is True  # Should default to True
             assert isinstance(source.id, uuid.UUID)  # Should auto-generate UUID
 
+    def test_source_article_count(self, app: "Flask") -> None:
+        """Test that article_count is counted without loading the articles."""
+        with app.app_context():
+            source = Source(name="Counted Source")
+            db.session.add(source)
+            db.session.commit()
+            db.session.add_all(
+                Article(
+                    title=f"Counted Article {i}",
+                    url=f"https://example.com/counted/{i}",
+                    source_id=source.id,
+                )
+                for i in range(3)
+            )
+            db.session.commit()
+
+            assert source.article_count == 3
+            assert "articles" not in source.__dict__
+
     def test_source_database_schema(self, app: "Flask") -> None:
         """Test that Source database schema matches model definition."""
         with app.app_context():
@@ -4,7 +4,7 @@ This module tests Topic model validation, constraints, and data integrity.
 """
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
 import pytest
@@ -12,6 +12,7 @@ from sqlalchemy import inspect
 from sqlalchemy.exc import IntegrityError
 
 from app.extensions import db
+from app.models.article import Article
 from app.models.topic import Topic
 
 if TYPE_CHECKING:
@@ -49,6 +50,19 @@ class TestTopic:
             assert isinstance(topic.added_at, datetime)
             assert isinstance(topic.updated_at, datetime)
 
+    def test_topic_timestamps_default_to_utc(self, app: "Flask") -> None:
+        """Test that default timestamps are stored as UTC wall-clock time."""
+        with app.app_context():
+            topic = Topic(label="UTC Topic")
+            db.session.add(topic)
+            db.session.commit()
+
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            added_at = topic.added_at.replace(tzinfo=None)
+            updated_at = topic.updated_at.replace(tzinfo=None)
+            assert abs(now - added_at) < timedelta(minutes=1)
+            assert abs(now - updated_at) < timedelta(minutes=1)
+
     def test_topic_timestamp_updates(self, app: "Flask") -> None:
         """Test that Topic timestamps are properly updated."""
         with app.app_context():
@@ -68,6 +82,25 @@ class TestTopic:
             # updated_at should change (though might be same if very fast)
             assert topic.updated_at >= original_updated_at
 
+    def test_topic_article_count(self, app: "Flask") -> None:
+        """Test that article_count is counted without loading the articles."""
+        with app.app_context():
+            topic = Topic(label="Counted Topic")
+            db.session.add(topic)
+            db.session.commit()
+            db.session.add_all(
+                Article(
+                    title=f"Counted Article {i}",
+                    url=f"https://example.com/counted/{i}",
+                    topic_id=topic.id,
+                )
+                for i in range(3)
+            )
+            db.session.commit()
+
+            assert topic.article_count == 3
+            assert "articles" not in topic.__dict__
+
     def test_topic_database_schema(self, app: "Flask") -> None:
         """Test that Topic database schema matches model definition."""
         with app.app_context():
@@ -8,16 +8,20 @@ functionality to ensure proper API response formatting.
 """
 
 import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
 from flask import Flask
 from marshmallow import ValidationError
+from sqlalchemy import event
 
+from app.extensions import db
 from app.models.article import Article
 from app.models.source import Source
 from app.models.topic import Topic
+from app.schemas import get_schema
 from app.schemas.article import ArticleSchema
 
 
@@ -179,7 +183,7 @@ class TestArticleSchema:
             assert "id" in errors
 
     def test_article_schema_add_computed_fields(self, app: Flask) -> None:
-        """Test the add_computed_fields post_dump method."""
+        """Test that age_days is computed from added_at."""
         with app.app_context():
             # Create an article with a specific added_at time
             past_time = datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
@@ -199,6 +203,15 @@ class TestArticleSchema:
             assert isinstance(result["age_days"], int)
             assert result["age_days"] > 0  # Should be positive for past dates
 
+    def test_get_schema_returns_shared_instances(self) -> None:
+        """Test that get_schema builds one instance per set of options."""
+        schema = get_schema(ArticleSchema, many=True, exclude=("topic",))
+
+        assert schema is get_schema(ArticleSchema, many=True, exclude=("topic",))
+        assert schema is not get_schema(ArticleSchema, many=True)
+        assert schema.many is True
+        assert "topic" not in schema.dump_fields
+
     def test_article_schema_many_serialization(self, app: Flask) -> None:
         """Test ArticleSchema serialization with many=True."""
         with app.app_context():
@@ -261,6 +274,40 @@ class TestArticleSchema:
             if result["source"]:
                 assert "name" in result["source"]
 
+    def test_article_schema_many_does_not_lazy_load_relationships(
+        self, app: Flask
+    ) -> None:
+        """Test that dumping queried articles does not issue a query per article."""
+        with app.app_context():
+            for i in range(10):
+                source = Source(name=f"Query Source {i}")
+                topic = Topic(label=f"Query Topic {i}")
+                article = Article(
+                    title=f"Query Article {i}", url=f"https://example.com/query-{i}"
+                )
+                article.topic = topic
+                article.source = source
+                db.session.add(article)
+            db.session.commit()
+            db.session.expunge_all()
+
+            statements: list[str] = []
+
+            def count_statement(*args: object) -> None:
+                statements.append(str(args[2]))
+
+            event.listen(db.engine, "before_cursor_execute", count_statement)
+            try:
+                result = ArticleSchema(many=True).dump(Article.query.all())
+            finally:
+                event.remove(db.engine, "before_cursor_execute", count_statement)
+
+            assert len(result) == 10
+            assert all(item["topic"] and item["source"] for item in result)
+            # Topic and source rows are each loaded in a single query for all articles
+            assert sum("topics.label" in sql for sql in statements) == 1
+            assert sum("sources.name" in sql for sql in statements) == 1
+
     def test_article_schema_handles_missing_added_at(self, app: Flask) -> None:
         """Test that schema handles articles without added_at gracefully."""
         with app.app_context():
@@ -297,41 +344,43 @@ class TestArticleSchema:
             assert result.topic_id is None
             assert result.source_id is None
 
-    def test_add_computed_fields_with_invalid_datetime(self, app: Flask) -> None:
-        """Test add_computed_fields method with invalid datetime to cover exception handling."""
+    def test_article_schema_age_days_naive_and_aware(self, app: Flask) -> None:
+        """Test age_days for naive and timezone-aware added_at values."""
         with app.app_context():
             schema = ArticleSchema()
+            naive = Article(
+                title="Naive Article",
+                url="https://test.com/naive",
+                added_at=datetime.now() - timedelta(days=3, hours=1),
+            )
+            aware = Article(
+                title="Aware Article",
+                url="https://test.com/aware",
+                added_at=datetime.now(timezone.utc) - timedelta(days=5, hours=1),
+            )
 
-            # Test with invalid datetime string that will cause ValueError
-            invalid_data = {
-                "id": str(uuid4()),
-                "title": "Test Article",
-                "url": "https://test.com/test",
-                "added_at": "invalid-datetime-string",
-            }
+            result = schema.dump([naive, aware], many=True)
 
-            # This should handle the exception and set age_days to None
-            result = schema.add_computed_fields(invalid_data)
-            assert "age_days" in result
-            assert result["age_days"] is None
+            assert result[0]["age_days"] == 3
+            assert result[1]["age_days"] == 5
 
-    def test_add_computed_fields_with_attribute_error(self, app: Flask) -> None:
-        """Test add_computed_fields method with data that causes AttributeError."""
+    def test_article_schema_reads_clock_once_per_dump(self, app: Flask) -> None:
+        """Test that a many=True dump reads the clock once for all articles."""
         with app.app_context():
-            schema = ArticleSchema()
+            articles = [
+                Article(
+                    title=f"Clock Article {i}",
+                    url=f"https://test.com/clock-{i}",
+                    added_at=datetime(2023, 1, 1, tzinfo=timezone.utc),
+                )
+                for i in range(5)
+            ]
 
-            # Test with a non-datetime object that doesn't have replace method
-            data_with_invalid_object = {
-                "id": str(uuid4()),
-                "title": "Test Article",
-                "url": "https://test.com/test",
-                "added_at": 12345,  # Integer instead of datetime
-            }
+            with patch("app.schemas.article.time.time", wraps=time.time) as mock_time:
+                result = ArticleSchema(many=True).dump(articles)
 
-            # This should handle the AttributeError and set age_days to None
-            result = schema.add_computed_fields(data_with_invalid_object)
-            assert "age_days" in result
-            assert result["age_days"] is None
+            assert mock_time.call_count == 1
+            assert len({item["age_days"] for item in result}) == 1
 
     def test_circular_reference_prevention_in_nested_relationships(
         self, app: Flask
@@ -9,15 +9,17 @@ functionality to ensure proper API response formatting.
 """
 
 import time
-from typing import Any
 from uuid import uuid4
 
 import pytest
 from flask import Flask
 from marshmallow import ValidationError
+from sqlalchemy import event
 
+from app.extensions import db
+from app.models.article import Article
 from app.models.source import Source
-from app.schemas.source import SourceSchema
+from app.schemas.source import SourceSchema, SourceWithArticlesSchema
 
 
 class TestSourceSchema:
@@ -57,6 +59,8 @@ class TestSourceSchema:
             assert result["logo_url"] == "https://example.com/logo.png"
             assert result["homepage_url"] == "https://example.com"
             assert result["is_enabled"] is True
+            # Not loaded from the database, so there is no count yet
+            assert result["article_count"] == 0
 
     def test_source_schema_deserialization(self, app: Flask) -> None:
         """Test that SourceSchema properly deserializes data to Source instances."""
@@ -77,31 +81,51 @@ class TestSourceSchema:
             assert result.homepage_url == "https://newsource.com"
             assert result.is_enabled is True
 
-    def test_source_schema_article_count_method(self, app: Flask) -> None:
-        """Test the get_article_count method computes correct article count."""
+    def test_source_schema_article_count_does_not_load_articles(
+        self, app: Flask
+    ) -> None:
+        """Test that article_count is dumped from a COUNT, not the collection."""
         with app.app_context():
-            # Create a mock source with articles attribute
-            class MockSource:
-                def __init__(self, articles: list[Any]) -> None:
-                    self.articles: list[Any] = articles
+            source = Source(name="Counted Source")
+            db.session.add(source)
+            db.session.commit()
+            db.session.add(
+                Article(
+                    title="Counted Article",
+                    url="https://example.com/counted",
+                    source_id=source.id,
+                )
+            )
+            db.session.commit()
 
-            schema = SourceSchema()
+            assert SourceSchema().dump(source)["article_count"] == 1
+            assert "articles" not in source.__dict__
+
+    def test_source_schema_many_counts_articles_in_one_query(self, app: Flask) -> None:
+        """Test that dumping queried sources does not issue a query per source."""
+        with app.app_context():
+            for i in range(5):
+                source = Source(name=f"Listed Source {i}")
+                source.articles.append(
+                    Article(title=f"Listed Article {i}", url=f"https://ex.com/{i}")
+                )
+                db.session.add(source)
+            db.session.commit()
+            db.session.expunge_all()
+
+            statements: list[str] = []
 
-            # Test with articles
-            source_with_articles = MockSource(articles=[1, 2, 3])
-            count = schema.get_article_count(source_with_articles)
-            assert count == 3
+            def count_statement(*args: object) -> None:
+                statements.append(str(args[2]))
 
-            # Test with empty articles
-            source_empty = MockSource(articles=[])
-            count = schema.get_article_count(source_empty)
-            assert count == 0
+            event.listen(db.engine, "before_cursor_execute", count_statement)
+            try:
+                result = SourceSchema(many=True).dump(Source.query.all())
+            finally:
+                event.remove(db.engine, "before_cursor_execute", count_statement)
 
-            # Test without articles attribute
-            source_no_attr = MockSource(articles=None)
-            delattr(source_no_attr, "articles")
-            count = schema.get_article_count(source_no_attr)
-            assert count == 0
+            assert [item["article_count"] for item in result] == [1] * 5
+            assert len(statements) == 1
 
     def test_source_schema_url_validation(self, app: Flask) -> None:
         """Test URL field validation in SourceSchema."""
@@ -185,7 +209,7 @@ class TestSourceSchema:
                 assert source_data["is_enabled"] is True
 
     def test_source_schema_nested_articles_excluded(self, app: Flask) -> None:
-        """Test that nested articles exclude source field to prevent circular references."""
+        """Test that articles are only nested by SourceWithArticlesSchema."""
         with app.app_context():
             # Create a source with the articles field defined in schema
             source = Source(
@@ -194,10 +218,13 @@ class TestSourceSchema:
                 is_enabled=True,
             )
 
-            schema = SourceSchema()
+            # The plain schema does not touch the articles collection
+            assert "articles" not in SourceSchema().dump(source)
+
+            schema = SourceWithArticlesSchema()
             result = schema.dump(source)
 
-            # Articles field should be present but likely empty since no actual articles
+            # Articles field should be present but empty since no actual articles
             assert "articles" in result
             assert isinstance(result["articles"], list)
 
@@ -263,7 +290,7 @@ class TestSourceSchema:
             source.articles = articles
 
             # Test that serialization handles circular references properly
-            schema = SourceSchema()
+            schema = SourceWithArticlesSchema()
             result = schema.dump(source)
 
             assert "articles" in result
@@ -12,7 +12,7 @@ from unittest.mock import patch
 import pytest
 from flask import Flask
 
-from app import create_app
+from app import create_app, log_request_end, log_request_start
 from app.extensions import alembic, db
 
 
@@ -224,6 +224,20 @@ class TestRouteRegistration:
             # We don't care about the exact response, just that the route exists
             assert response.status_code in [200, 404, 405]  # Any valid HTTP response
 
+    def test_url_map_compiled_at_creation(self) -> None:
+        """Test that the URL map is compiled before the first request."""
+        app = create_app({"SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
+
+        assert app.url_map._remap is False  # pyright: ignore[reportPrivateUsage]
+
+        # Routes added afterwards are still picked up on the next match
+        @app.route("/added-later")
+        def added_later() -> str:  # pyright: ignore[reportUnusedFunction]
+            return "ok"
+
+        with app.test_client() as client:
+            assert client.get("/added-later").status_code == 200
+
     def test_route_registration_integration(self) -> None:
         """Test that route registration is properly integrated in the factory."""
         with patch("app.routes.register_routes") as mock_register:
@@ -272,6 +286,17 @@ class TestApplicationFactoryIntegration:
         assert app1.config["TESTING"] is True
         assert app2.config["TESTING"] is False
 
+    def test_request_hooks_shared_across_instances(self) -> None:
+        """Test that every app registers the same module-level request hooks."""
+        config = {"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"}
+
+        app1 = create_app(config)
+        app2 = create_app(config)
+
+        for app in (app1, app2):
+            assert log_request_start in app.before_request_funcs[None]
+            assert log_request_end in app.after_request_funcs[None]
+
     def test_app_context_isolation(self) -> None:
         """Test that application contexts are properly isolated."""
         app1 = create_app({"SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
@@ -321,6 +346,24 @@ class TestApplicationFactoryIntegration:
             app = create_app(None)
             assert isinstance(app, Flask)
 
+    def test_factory_does_not_create_tables(self) -> None:
+        """Test that schema creation is left to migrations, not the factory."""
+        with patch.object(db, "create_all") as mock_create_all:
+            create_app({"SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
+            mock_create_all.assert_not_called()
+
+    def test_factory_submodules_are_loaded_once(self) -> None:
+        """Test that factory submodules are imported once and then reused."""
+        import app as app_package
+
+        create_app({"SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
+        loaded = dict(app_package._LOADED)  # pyright: ignore[reportPrivateUsage]
+
+        assert "app.routes" in loaded
+        with patch("importlib.import_module") as mock_import:
+            create_app({"SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
+            mock_import.assert_not_called()
+
     def test_factory_component_order(self) -> None:
         """Test that factory components are initialized in the correct order."""
         with (
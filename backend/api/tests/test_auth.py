@@ -1,15 +1,20 @@
 """Tests for authentication utilities."""
 
 import logging
+import subprocess
+import sys
+from typing import cast
 from unittest.mock import MagicMock, patch
 
+import bcrypt
 from _pytest.logging import LogCaptureFixture
 from flask import Flask, Response, g, jsonify
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.auth import require_api_key
 from app.extensions import db
-from app.models.api_client import ApiClient
+from app.models.api_client import ApiClient, hash_api_key
+from app.usage_stats import usage_stats
 
 
 class TestRequireApiKeyDecorator:
@@ -31,6 +36,24 @@ class TestRequireApiKeyDecorator:
         assert data["error"] == "Authentication failed"
         assert data["message"] == "API key is required"
 
+    def test_require_api_key_error_responses_not_shared(self, app: Flask) -> None:
+        """Test each rejected request gets its own response object."""
+
+        @app.route("/auth-not-shared")
+        @require_api_key
+        def protected_view() -> tuple[Response, int]:
+            return jsonify({"message": "success"}), 200
+
+        with app.test_request_context("/auth-not-shared"):
+            first = cast(Response, protected_view())
+            first.headers["X-Test"] = "mutated"
+            second = cast(Response, protected_view())
+
+        assert first is not second
+        assert "X-Test" not in second.headers
+        assert second.mimetype == "application/json"
+        assert second.get_json()["message"] == "API key is required"
+
     def test_require_api_key_empty_header(self, app: Flask) -> None:
         """Test authentication fails when API key header is empty."""
 
@@ -150,11 +173,21 @@ class TestRequireApiKeyDecorator:
         assert response.status_code == 200
         assert response.get_json()["message"] == "success"
 
-        # Verify usage statistics were updated
+        # Verify usage statistics were recorded once the buffer is flushed
+        assert usage_stats.flush() == 1
         db.session.refresh(api_client)
         assert api_client.use_count == original_use_count + 1
         assert api_client.last_used_at is not None
 
+    def test_auth_import_does_not_load_models(self) -> None:
+        """Test that importing the decorator does not import the models."""
+        code = (
+            "import sys, app.auth; "
+            + "sys.exit('app.models.api_client' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], check=False)
+        assert result.returncode == 0
+
     def test_require_api_key_preserves_function_metadata(self) -> None:
         """Test that decorator preserves original function metadata."""
 
@@ -256,16 +289,18 @@ class TestRequireApiKeyDecorator:
         assert len(warning_logs) == 1
         assert "Missing API key" in warning_logs[0].message
 
-    @patch("app.auth.db.session.commit")
+    @patch("app.usage_stats._write_usage")
     def test_require_api_key_database_error_handling(
         self,
-        mock_commit: MagicMock,
+        mock_write: MagicMock,
         app: Flask,
         sample_api_client: tuple[ApiClient, str],
         caplog: LogCaptureFixture,
     ) -> None:
         """Test handling of database errors during usage statistics update."""
-        mock_commit.side_effect = SQLAlchemyError("Database connection failed")
+        mock_write.side_effect = SQLAlchemyError("Database connection failed")
+        # Flush on every request so the failing write happens in the request path
+        app.config["USAGE_STATS_FLUSH_INTERVAL"] = 0
         api_client, api_key = sample_api_client
 
         @app.route("/auth-db-error")
@@ -317,7 +352,7 @@ class TestRequireApiKeyDecorator:
         app: Flask,
         sample_api_client: tuple[ApiClient, str],
     ) -> None:
-        """Test graceful handling of unexpected errors."""
+        """Test that unexpected errors are handled by the app's 500 handler."""
         mock_check.side_effect = Exception("Unexpected error")
         api_client, api_key = sample_api_client
 
@@ -331,7 +366,25 @@ class TestRequireApiKeyDecorator:
             response = client.get("/auth-unexpected-error", headers=headers)
 
         assert response.status_code == 500
-        assert str(response.get_json()["error"]) == "Authentication service error"
+        assert str(response.get_json()["error"]) == "Internal Server Error"
+
+    def test_require_api_key_view_errors_not_reported_as_auth_errors(
+        self, app: Flask, sample_api_client: tuple[ApiClient, str]
+    ) -> None:
+        """Test that database errors raised by the view are not auth failures."""
+        api_client, api_key = sample_api_client
+
+        @app.route("/auth-view-error")
+        @require_api_key
+        def protected_view() -> tuple[Response, int]:
+            raise SQLAlchemyError("View query failed")
+
+        headers = {"X-API-Key": f"{api_client.name}.{api_key}"}
+        with app.test_client() as client:
+            response = client.get("/auth-view-error", headers=headers)
+
+        assert response.status_code == 500
+        assert str(response.get_json()["error"]) == "Internal Server Error"
 
     def test_require_api_key_x_forwarded_for_header(
         self,
@@ -391,6 +444,129 @@ class TestRequireApiKeyDecorator:
         assert response.status_code == 401
         mock_check.assert_called_once_with("wrong-key")
 
+    def test_require_api_key_unknown_client_still_hashes_key(self, app: Flask) -> None:
+        """Ensure an unknown client name costs the same key hash as a wrong key."""
+
+        @app.route("/auth-unknown-client")
+        @require_api_key
+        def protected_view() -> tuple[Response, int]:
+            return jsonify({"message": "success"}), 200
+
+        headers = {"X-API-Key": "no-such-client.some-key"}
+        with patch(
+            "app.models.api_client.hash_api_key", side_effect=hash_api_key
+        ) as mock_hash:
+            with app.test_client() as test_client:
+                response = test_client.get("/auth-unknown-client", headers=headers)
+
+        assert response.status_code == 401
+        assert response.get_json()["message"] == "Invalid or inactive API key"
+        mock_hash.assert_called_once_with("some-key")
+
+    def test_require_api_key_verifies_single_client(self, app: Flask) -> None:
+        """Ensure only the named client's hash is verified, not every active client."""
+        clients = [ApiClient.create_with_api_key(f"client-{i}") for i in range(5)]
+        for client, _api_key in clients:
+            db.session.add(client)
+        db.session.commit()
+        target, target_key = clients[3]
+
+        @app.route("/auth-single-client")
+        @require_api_key
+        def protected_view() -> tuple[Response, int]:
+            return jsonify({"message": "success"}), 200
+
+        original_check = ApiClient.check_api_key
+        headers = {"X-API-Key": f"{target.name}.{target_key}"}
+        with patch.object(
+            ApiClient, "check_api_key", autospec=True, side_effect=original_check
+        ) as mock_check:
+            with app.test_client() as test_client:
+                response = test_client.get("/auth-single-client", headers=headers)
+
+        assert response.status_code == 200
+        mock_check.assert_called_once()
+        assert mock_check.call_args.args[0].name == target.name
+
+    def test_require_api_key_rehashes_legacy_bcrypt_key(self, app: Flask) -> None:
+        """Test that a legacy bcrypt hash is upgraded after a successful check."""
+        client = ApiClient(name="legacy-client")
+        client.hashed_api_key = bcrypt.hashpw(
+            b"legacy-key", bcrypt.gensalt(rounds=4)
+        ).decode("utf-8")
+        db.session.add(client)
+        db.session.commit()
+
+        @app.route("/auth-rehash")
+        @require_api_key
+        def protected_view() -> tuple[Response, int]:
+            return jsonify({"message": "success"}), 200
+
+        headers = {"X-API-Key": "legacy-client.legacy-key"}
+        with app.test_client() as test_client:
+            response = test_client.get("/auth-rehash", headers=headers)
+
+        assert response.status_code == 200
+        db.session.refresh(client)
+        assert client.needs_rehash is False
+        assert client.check_api_key("legacy-key") is True
+
+
+class TestAuthenticationRevocation:
+    """Test cases for keys that stop being valid between requests."""
+
+    def test_key_rejected_after_deactivation(
+        self, app: Flask, sample_api_client: tuple[ApiClient, str]
+    ) -> None:
+        """Test that deactivating a client rejects its key right away."""
+        api_client, api_key = sample_api_client
+
+        @app.route("/auth-deactivated")
+        @require_api_key
+        def protected_view() -> tuple[Response, int]:
+            return jsonify({"message": "success"}), 200
+
+        headers = {"X-API-Key": f"{api_client.name}.{api_key}"}
+        with app.test_client() as client:
+            assert client.get("/auth-deactivated", headers=headers).status_code == 200
+
+            api_client.is_active = False
+            db.session.commit()
+
+            response = client.get("/auth-deactivated", headers=headers)
+
+        assert response.status_code == 401
+        assert response.get_json()["message"] == "Invalid or inactive API key"
+
+    def test_old_key_rejected_after_rotation(
+        self, app: Flask, sample_api_client: tuple[ApiClient, str]
+    ) -> None:
+        """Test that rotating a client's key rejects the old key right away."""
+        api_client, old_api_key = sample_api_client
+
+        @app.route("/auth-rotated")
+        @require_api_key
+        def protected_view() -> tuple[Response, int]:
+            return jsonify({"message": "success"}), 200
+
+        old_headers = {"X-API-Key": f"{api_client.name}.{old_api_key}"}
+        with app.test_client() as client:
+            assert client.get("/auth-rotated", headers=old_headers).status_code == 200
+
+            new_api_key = ApiClient.generate_api_key()
+            api_client.set_api_key(new_api_key)
+            db.session.commit()
+
+            old_response = client.get("/auth-rotated", headers=old_headers)
+            new_response = client.get(
+                "/auth-rotated",
+                headers={"X-API-Key": f"{api_client.name}.{new_api_key}"},
+            )
+
+        assert old_response.status_code == 401
+        assert old_response.get_json()["message"] == "Invalid or inactive API key"
+        assert new_response.status_code == 200
+
 
 class TestAuthenticationIntegration:
     """Integration tests for authentication with Flask routes."""
@@ -8,16 +8,53 @@ import os
 from unittest.mock import patch
 
 import pytest
+from flask import Config
 
 # NOTE: TestingConfig needs to be imported as EnvTestingConfig to not confuse pytest into thinking it as a Class containing tests
 from app.config import (
+    DOTENV_LOADED_VAR,
     BaseConfig,
     DevelopmentConfig,
     ProductionConfig,
+    clear_config_cache,
     config_by_name,
     get_config,
+    load_env,
 )
 from app.config import TestingConfig as EnvTestingConfig
+from app.validators import ConfigurationError
+
+
+class TestLoadEnv:
+    """Test the cached .env loader."""
+
+    def test_load_env_parses_dotenv_once(self) -> None:
+        """Test that repeated load_env calls only parse the .env file once."""
+        load_env.cache_clear()
+        try:
+            with (
+                patch.dict(os.environ),
+                patch("app.config.load_dotenv", return_value=True) as mock_load,
+            ):
+                os.environ.pop(DOTENV_LOADED_VAR, None)
+                assert load_env() is True
+                assert load_env() is True
+                mock_load.assert_called_once()
+        finally:
+            load_env.cache_clear()
+
+    def test_load_env_skipped_when_parent_loaded_dotenv(self) -> None:
+        """Test that a process inheriting the loaded flag does not reparse .env."""
+        load_env.cache_clear()
+        try:
+            with (
+                patch.dict(os.environ, {DOTENV_LOADED_VAR: "1"}),
+                patch("app.config.load_dotenv") as mock_load,
+            ):
+                assert load_env() is True
+                mock_load.assert_not_called()
+        finally:
+            load_env.cache_clear()
 
 
 class TestBaseConfig:
@@ -123,6 +160,7 @@ class TestProductionConfig:
         assert config.DEBUG is False
         assert config.TESTING is False
         assert config.LOG_LEVEL == "ERROR"
+        assert config.JSONIFY_PRETTYPRINT_REGULAR is False
 
     def test_production_config_cors(self) -> None:
         """Test production-specific CORS settings."""
@@ -137,6 +175,7 @@ class TestProductionConfig:
         os.environ,
         {
             "SECRET_KEY": "very-long-secret-key-for-production-use-that-meets-32-character-minimum",
+            "API_KEY_PEPPER": "production-api-key-pepper",
             "DATABASE_URI": "postgresql://prod:secret@db:5432/ernesto_prod",
             "CHROME_EXTENSION_IDS": "abcdefghijklmnopabcdefghijklmnop",
         },
@@ -152,6 +191,7 @@ class TestProductionConfig:
         os.environ,
         {
             "SECRET_KEY": "very-long-secret-key-for-production-use-that-meets-32-character-minimum",
+            "API_KEY_PEPPER": "production-api-key-pepper",
             "DATABASE_URI": "postgresql://prod:secret@db:5432/ernesto_prod",
             "CHROME_EXTENSION_IDS": "idoneidoneidoneidoneidoneidon, idtwoidtwoidtwoidtwoidtwoidtw",
         },
@@ -168,6 +208,7 @@ class TestProductionConfig:
         os.environ,
         {
             "SECRET_KEY": "very-long-secret-key-for-production-use-that-meets-32-character-minimum",
+            "API_KEY_PEPPER": "production-api-key-pepper",
             "DATABASE_URI": "postgresql://prod:secret@db:5432/ernesto_prod",
             "CHROME_EXTENSION_IDS": " id1 , , id2  ",
         },
@@ -184,6 +225,7 @@ class TestProductionConfig:
         os.environ,
         {
             "SECRET_KEY": "very-long-secret-key-for-production-use-that-meets-32-character-minimum",
+            "API_KEY_PEPPER": "production-api-key-pepper",
             "DATABASE_URI": "postgresql://prod:secret@db:5432/ernesto_prod",
             "CHROME_EXTENSION_IDS": "abcdefghijklmnopabcdefghijklmnop",
         },
@@ -199,14 +241,15 @@ class TestProductionConfig:
         """Test that production config validation fails with missing env vars."""
         with pytest.raises(
             ValueError,
-            match="Missing required environment variables for production: SECRET_KEY, DATABASE_URI",
+            match="Missing required environment variables for production: SECRET_KEY, DATABASE_URI, API_KEY_PEPPER",
         ):
             get_config("prod")
 
     @patch.dict(
         os.environ,
         {
-            "SECRET_KEY": "very-long-secret-key-for-production-use-that-meets-32-character-minimum"
+            "SECRET_KEY": "very-long-secret-key-for-production-use-that-meets-32-character-minimum",
+            "API_KEY_PEPPER": "production-api-key-pepper",
         },
         clear=True,
     )
@@ -218,6 +261,80 @@ class TestProductionConfig:
         ):
             get_config("prod")
 
+    @patch.dict(os.environ, {}, clear=True)
+    def test_production_config_validation_reports_missing_vars(self) -> None:
+        """Test that the missing variable names are available on the error."""
+        with pytest.raises(ValueError) as exc_info:
+            get_config("prod")
+
+        cause = exc_info.value.__cause__
+        assert isinstance(cause, ConfigurationError)
+        assert cause.missing_vars == ["SECRET_KEY", "DATABASE_URI", "API_KEY_PEPPER"]
+
+
+class TestConfigAsDict:
+    """Test exporting configuration instances as plain settings."""
+
+    @pytest.mark.parametrize(
+        "config_class",
+        [BaseConfig, DevelopmentConfig, EnvTestingConfig, ProductionConfig],
+    )
+    def test_as_dict_matches_from_object(self, config_class: type[BaseConfig]) -> None:
+        """Test that as_dict yields exactly what Flask's from_object would load."""
+        config = config_class({"CHROME_EXTENSION_IDS": "a" * 32})
+        expected = Config(".")
+        expected.from_object(config)
+
+        assert config.as_dict() == dict(expected)
+
+    def test_as_dict_reflects_instance_overrides(self) -> None:
+        """Test that values set on an instance override class constants."""
+        config = BaseConfig({})
+        config.DEBUG = True
+
+        settings = config.as_dict()
+
+        assert settings["DEBUG"] is True
+        assert BaseConfig({}).as_dict()["DEBUG"] is False
+        assert "_secret_key_default" not in settings
+
+
+class TestConfigEnvironment:
+    """Test reading configuration from an explicit environment mapping."""
+
+    def test_config_reads_explicit_env(self) -> None:
+        """Test that a config built from a mapping ignores os.environ."""
+        env = {
+            "SECRET_KEY": "mapping-secret-key",
+            "DATABASE_URI": "sqlite:///mapping.db",
+            "SQLALCHEMY_TRACK_MODIFICATIONS": "true",
+        }
+        with patch.dict(os.environ, {"DATABASE_URI": "sqlite:///environ.db"}):
+            config = DevelopmentConfig(env)
+
+        assert config.SECRET_KEY == "mapping-secret-key"
+        assert config.SQLALCHEMY_DATABASE_URI == "sqlite:///mapping.db"
+        assert config.SQLALCHEMY_TRACK_MODIFICATIONS is True
+
+    def test_production_config_has_no_secret_key_fallback(self) -> None:
+        """Test that production leaves SECRET_KEY empty when it is not set."""
+        config = ProductionConfig({})
+
+        assert config.SECRET_KEY == ""
+        assert DevelopmentConfig({}).SECRET_KEY == (
+            "dev-secret-key-change-in-production"
+        )
+
+    def test_production_config_reads_explicit_env(self) -> None:
+        """Test that production CORS origins come from the given mapping."""
+        env = {"CHROME_EXTENSION_IDS": "abcdefghijklmnopabcdefghijklmnop"}
+        with patch.dict(os.environ, {}, clear=True):
+            config = ProductionConfig(env)
+
+        assert config.CORS_ORIGINS == [
+            "chrome-extension://abcdefghijklmnopabcdefghijklmnop"
+        ]
+
 
 class TestConfigMapping:
     """Test the configuration mapping and get_config function."""
@@ -255,6 +372,44 @@ class TestConfigMapping:
         config_instance = get_config("test")
         assert isinstance(config_instance, EnvTestingConfig)
 
+    def test_get_config_reuses_instance_for_same_environment(self) -> None:
+        """Test that get_config builds and validates each configuration once."""
+        with patch.dict(os.environ, {"DATABASE_URI": "sqlite:///cached.db"}):
+            first = get_config("development")
+            assert get_config("dev") is first
+
+            with patch("app.config.validate_config") as mock_validate:
+                assert get_config("development") is first
+            mock_validate.assert_not_called()
+
+    def test_get_config_default_name_shares_cache(self) -> None:
+        """Test that get_config() without a name reuses the named instance."""
+        with patch.dict(
+            os.environ, {"FLASK_ENV": "testing", "DATABASE_URI": "sqlite:///x.db"}
+        ):
+            assert get_config() is get_config("testing")
+            assert get_config() is get_config()
+
+    def test_clear_config_cache_forces_new_instance(self) -> None:
+        """Test that clear_config_cache discards the shared instances."""
+        first = get_config("testing")
+        clear_config_cache()
+        second = get_config("testing")
+
+        assert first is not second
+        assert get_config("test") is second
+
+    def test_get_config_rebuilds_when_environment_changes(self) -> None:
+        """Test that a changed environment variable yields a new configuration."""
+        with patch.dict(os.environ, {"DATABASE_URI": "sqlite:///first.db"}):
+            first = get_config("development")
+        with patch.dict(os.environ, {"DATABASE_URI": "sqlite:///second.db"}):
+            second = get_config("development")
+
+        assert first is not second
+        assert first.SQLALCHEMY_DATABASE_URI == "sqlite:///first.db"
+        assert second.SQLALCHEMY_DATABASE_URI == "sqlite:///second.db"
+
     def test_get_config_invalid(self) -> None:
         """Test that get_config raises ValueError for invalid config names."""
         with pytest.raises(ValueError, match="Unknown configuration 'invalid'"):
@@ -276,6 +431,7 @@ class TestConfigMapping:
         os.environ,
         {
             "SECRET_KEY": "very-long-secret-key-for-production-use-that-meets-32-character-minimum",
+            "API_KEY_PEPPER": "production-api-key-pepper",
             "DATABASE_URI": "postgresql://prod:secret@db:5432/ernesto_prod",
             "CHROME_EXTENSION_IDS": "abcdefghijklmnopabcdefghijklmnop",
         },
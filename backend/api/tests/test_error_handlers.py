@@ -8,7 +8,7 @@ import json
 from typing import NoReturn
 
 import pytest
-from flask import Flask
+from flask import Flask, Response
 from flask.testing import FlaskClient
 
 from app import create_app
@@ -47,6 +47,23 @@ class TestErrorHandlers:
         assert data["message"] == "The requested resource could not be found."
         assert data["status_code"] == 404
 
+    def test_404_responses_are_not_shared(self, app: Flask) -> None:
+        """Test that each error gets its own response object."""
+
+        @app.after_request
+        def tag_response(  # pyright: ignore[reportUnusedFunction]
+            response: Response,
+        ) -> Response:
+            response.headers.add("X-Tag", "seen")
+            return response
+
+        with app.test_client() as client:
+            client.get("/nonexistent-route")
+            response = client.get("/nonexistent-route")
+
+        assert response.headers.getlist("X-Tag") == ["seen"]
+        assert json.loads(response.data)["status_code"] == 404
+
     def test_405_method_not_allowed_handler(
         self, app: Flask, client: "FlaskClient"
     ) -> None:
@@ -4,10 +4,15 @@ This module tests the proper initialization and configuration of all Flask exten
 used in the application, with special focus on CORS extension integration.
 """
 
-from flask import Flask
+import re
+from pathlib import Path
+from typing import cast
+
+from flask import Flask, Response
+from sqlalchemy import text
 
 from app import create_app
-from app.extensions import alembic, cors, db, ma
+from app.extensions import alembic, compile_cors_origins, cors, db, ma
 
 
 class TestCORSExtensionInitialization:
@@ -80,12 +85,13 @@ class TestCORSExtensionInitialization:
             assert any("localhost" in origin for origin in cors_origins)
             assert any("127.0.0.1" in origin for origin in cors_origins)
 
-    def test_cors_production_configuration(self) -> None:
+    def test_cors_production_configuration(self, tmp_path: Path) -> None:
         """Test CORS configuration in production environment."""
         production_config = {
             "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
             "SECRET_KEY": "production-secret-key",
             "DEBUG": False,
+            "LOG_FILE": str(tmp_path / "ernesto_api.log"),
             "CORS_ORIGINS": [],  # Empty by default for security
             "CORS_SUPPORTS_CREDENTIALS": False,
         }
@@ -194,6 +200,43 @@ class TestCORSExtensionInitialization:
             # Flask-CORS handles OPTIONS requests automatically
             assert response.status_code in [200, 404]
 
+    def test_compile_cors_origins(self) -> None:
+        """Test that only usable regex origins are precompiled."""
+        origins = compile_cors_origins(
+            [
+                r"http://localhost:.*",
+                "chrome-extension://abcdefghijklmnopabcdefghijklmnop",
+                "*",
+                "(unbalanced",
+            ]
+        )
+
+        assert isinstance(origins[0], re.Pattern)
+        assert origins[0].match("HTTP://LOCALHOST:5173")
+        assert origins[1:] == [
+            "chrome-extension://abcdefghijklmnopabcdefghijklmnop",
+            "*",
+            "(unbalanced",
+        ]
+
+    def test_cors_regex_origin_matches_request(self) -> None:
+        """Test that a precompiled regex origin still allows matching requests."""
+        app = create_app(
+            {
+                "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+                "CORS_ORIGINS": [r"http://localhost:.*"],
+            }
+        )
+
+        with app.test_client() as client:
+            allowed = client.get("/", headers={"Origin": "http://localhost:3000"})
+            denied = client.get("/", headers={"Origin": "http://example.com"})
+
+        assert allowed.headers["Access-Control-Allow-Origin"] == (
+            "http://localhost:3000"
+        )
+        assert "Access-Control-Allow-Origin" not in denied.headers
+
 
 class TestExtensionIntegration:
     """Test cases for overall extension integration."""
@@ -234,6 +277,40 @@ class TestExtensionIntegration:
             # Verify Alembic is initialized (requires SQLAlchemy and models)
             assert alembic is not None
 
+    def test_sqlite_foreign_keys_enforced(self, app: Flask) -> None:
+        """Test that SQLite connections enforce foreign key constraints."""
+        assert db.session.execute(text("PRAGMA foreign_keys")).scalar() == 1
+
+    def test_json_provider_follows_config(self) -> None:
+        """Test that JSON settings are applied to Flask's JSON provider."""
+        app = create_app(
+            {
+                "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+                "DEBUG": True,
+                "JSON_SORT_KEYS": False,
+                "JSONIFY_PRETTYPRINT_REGULAR": False,
+            }
+        )
+
+        with app.app_context():
+            response = cast(Response, app.json.response({"b": 1, "a": 2}))
+
+        assert response.get_data(as_text=True) == '{"b":1,"a":2}\n'
+
+    def test_json_provider_pretty_prints_when_configured(self) -> None:
+        """Test that JSONIFY_PRETTYPRINT_REGULAR enables indented output."""
+        app = create_app(
+            {
+                "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+                "JSONIFY_PRETTYPRINT_REGULAR": True,
+            }
+        )
+
+        with app.app_context():
+            response = cast(Response, app.json.response({"a": 1}))
+
+        assert response.get_data(as_text=True) == '{\n  "a": 1\n}\n'
+
     def test_extension_configuration_validation(self) -> None:
         """Test extension configuration validation."""
         # Test that CORS configuration is handled properly
@@ -7,15 +7,26 @@ environment configurations, log level parsing, and handler setup.
 import logging
 import os
 import tempfile
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Optional
 from unittest.mock import MagicMock, patch
 
-from app import create_app
+from flask import Flask
+
+from app import create_app, logging_config
 from app.logging_config import (
+    QUEUE_LISTENER_EXTENSION,
     _get_environment_name,  # pyright: ignore[reportPrivateUsage]
     configure_logging,
 )
 
 
+def _queue_listener(app: Flask) -> Optional[QueueListener]:
+    """Return the running production log listener of an application, if any."""
+    return app.extensions.get(QUEUE_LISTENER_EXTENSION)
+
+
 class TestLoggingConfiguration:
     """Test suite for logging configuration functionality."""
 
@@ -68,7 +79,7 @@ class TestLoggingConfiguration:
     @patch("os.makedirs")
     @patch("os.path.exists")
     def test_configure_logging_production(
-        self, mock_exists: MagicMock, mock_makedirs: MagicMock
+        self, mock_exists: MagicMock, mock_makedirs: MagicMock, tmp_path: Path
     ) -> None:
         """Test logging configuration for production environment."""
         mock_exists.return_value = False  # Simulate logs directory doesn't exist
@@ -78,6 +89,7 @@ class TestLoggingConfiguration:
                 "TESTING": False,
                 "DEBUG": False,
                 "LOG_LEVEL": "ERROR",
+                "LOG_FILE": str(tmp_path / "ernesto_api.log"),
                 "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
             }
         )
@@ -86,11 +98,16 @@ class TestLoggingConfiguration:
             # Verify logger level is set correctly
             assert app.logger.level == logging.ERROR
 
-            # Verify handlers are added (file + console)
-            assert len(app.logger.handlers) == 2
+            # Verify a single non-blocking queue handler is attached; file and
+            # console handlers are served by the listener thread
+            assert len(app.logger.handlers) == 1
+            assert isinstance(app.logger.handlers[0], QueueHandler)
+            listener = _queue_listener(app)
+            assert listener is not None
+            assert len(listener.handlers) == 2
 
             # Verify logs directory creation was attempted
-            mock_makedirs.assert_called_once()
+            mock_makedirs.assert_called_once_with(str(tmp_path))
 
     def test_log_level_parsing(self) -> None:
         """Test that log levels are correctly parsed from configuration."""
@@ -120,7 +137,7 @@ class TestLoggingConfiguration:
                 else:
                     assert app.logger.level == expected_level
 
-    def test_get_environment_name(self) -> None:
+    def test_get_environment_name(self, tmp_path: Path) -> None:
         """Test environment name detection."""
         # Test testing environment
         app = create_app(
@@ -149,6 +166,7 @@ class TestLoggingConfiguration:
             {
                 "TESTING": False,
                 "DEBUG": False,
+                "LOG_FILE": str(tmp_path / "ernesto_api.log"),
                 "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
             }
         )
@@ -188,26 +206,92 @@ class TestLoggingConfiguration:
                 mock_info.assert_called_once_with("Test message")
 
     def test_production_file_logging_path(self) -> None:
-        """Test that production logging creates the correct file path."""
+        """Test that production logging defaults to logs/ next to the instance."""
         with tempfile.TemporaryDirectory() as temp_dir:
-            app = create_app(
-                {
-                    "TESTING": False,
-                    "DEBUG": False,
-                    "LOG_LEVEL": "ERROR",
-                    "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
-                }
-            )
+            app = Flask(__name__, instance_path=os.path.join(temp_dir, "instance"))
+            app.config.update(TESTING=False, DEBUG=False, LOG_LEVEL="ERROR")
+
+            configure_logging(app)
+            app.logger.error("Default path error")
+            logging_config._stop_queue_listener(app)  # pyright: ignore[reportPrivateUsage]
 
-            # Mock the instance_path to use our temp directory
-            app.instance_path = os.path.join(temp_dir, "instance")
+            with open(os.path.join(temp_dir, "logs", "ernesto_api.log")) as log_file:
+                assert "Default path error" in log_file.read()
 
-            with app.app_context():
-                configure_logging(app)
+    def test_production_records_written_by_listener(self, tmp_path: Path) -> None:
+        """Test that queued production records reach the file handler."""
+        log_file = tmp_path / "ernesto_api.log"
+        app = create_app(
+            {
+                "TESTING": False,
+                "DEBUG": False,
+                "LOG_LEVEL": "ERROR",
+                "LOG_FILE": str(log_file),
+                "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+            }
+        )
+
+        app.logger.error("Queued production error")
+        logging_config._stop_queue_listener(app)  # pyright: ignore[reportPrivateUsage]
+
+        assert "Queued production error" in log_file.read_text()
+
+    def test_reconfiguring_stops_previous_listener(self, tmp_path: Path) -> None:
+        """Test that configuring logging again does not leak listener threads."""
+        app = create_app(
+            {
+                "TESTING": False,
+                "DEBUG": False,
+                "LOG_LEVEL": "ERROR",
+                "LOG_FILE": str(tmp_path / "ernesto_api.log"),
+                "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+            }
+        )
+        first = _queue_listener(app)
+        configure_logging(app)
+
+        assert first is not None
+        assert first._thread is None  # pyright: ignore[reportPrivateUsage]
+        assert _queue_listener(app) is not first
+        logging_config._stop_queue_listener(app)  # pyright: ignore[reportPrivateUsage]
+
+    def test_listeners_are_per_app(self, tmp_path: Path) -> None:
+        """Test that configuring a second app keeps the first app's listener."""
+        configs = [
+            {
+                "TESTING": False,
+                "DEBUG": False,
+                "LOG_LEVEL": "ERROR",
+                "LOG_FILE": str(tmp_path / f"app{i}.log"),
+                "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+            }
+            for i in range(2)
+        ]
+        first_app = create_app(configs[0])
+        second_app = create_app(configs[1])
+
+        first = _queue_listener(first_app)
+        assert first is not None
+        assert first._thread is not None  # pyright: ignore[reportPrivateUsage]
+        assert _queue_listener(second_app) is not first
+
+        first_app.logger.error("First app error")
+        logging_config._stop_queue_listener(first_app)  # pyright: ignore[reportPrivateUsage]
+        logging_config._stop_queue_listener(second_app)  # pyright: ignore[reportPrivateUsage]
+
+        assert "First app error" in (tmp_path / "app0.log").read_text()
+
+    def test_logging_globals_left_untouched(self) -> None:
+        """Test that configuring logging keeps process-wide record metadata."""
+        create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
+
+        record = logging.getLogger("app").makeRecord(
+            "app", logging.ERROR, "test.py", 1, "message", (), None
+        )
 
-                # We can't easily test the actual file creation without mocking,
-                # but we can verify the configuration doesn't raise errors
-                assert len(app.logger.handlers) >= 1
+        assert record.thread is not None
+        assert record.process is not None
+        assert record.processName is not None
 
     def test_log_message_formatting(self) -> None:
         """Test that log messages are formatted correctly for different environments."""
@@ -243,7 +327,7 @@ class TestLoggingConfiguration:
             assert "test" in formatted
             assert "Test message" in formatted
 
-    def test_production_dual_handlers(self) -> None:
+    def test_production_dual_handlers(self, tmp_path: Path) -> None:
         """Test that production environment has both file and console handlers."""
         with patch("os.makedirs"), patch("os.path.exists", return_value=True):
             app = create_app(
@@ -251,15 +335,18 @@ class TestLoggingConfiguration:
                     "TESTING": False,
                     "DEBUG": False,
                     "LOG_LEVEL": "ERROR",
+                    "LOG_FILE": str(tmp_path / "ernesto_api.log"),
                     "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
                 }
             )
 
             with app.app_context():
-                # Should have 2 handlers: file and console
-                assert len(app.logger.handlers) == 2
+                # Should have 2 handlers behind the queue: file and console
+                listener = _queue_listener(app)
+                assert listener is not None
+                assert len(listener.handlers) == 2
 
                 # Verify handler types
-                handler_types = [type(h).__name__ for h in app.logger.handlers]
+                handler_types = [type(h).__name__ for h in listener.handlers]
                 assert "RotatingFileHandler" in handler_types
                 assert "StreamHandler" in handler_types
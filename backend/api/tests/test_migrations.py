@@ -225,6 +225,10 @@ class TestMigrations:
             assert "topics" in fk_tables, "Missing foreign key to topics table"
             assert "sources" in fk_tables, "Missing foreign key to sources table"
 
+            # Deleting a topic or source removes its articles in the database
+            for fk in articles_fks:
+                assert fk.get("options", {}).get("ondelete") == "CASCADE"
+
     def test_migration_creates_indexes(self, empty_db_app: Flask) -> None:
         """Test that migrations create proper indexes."""
         with empty_db_app.app_context():
@@ -241,6 +245,27 @@ class TestMigrations:
             assert ["topic_id"] in index_columns, "Missing index on topic_id"
             assert ["source_id"] in index_columns, "Missing index on source_id"
 
+            # Feed indexes: foreign key plus added_at for "latest articles" queries
+            assert [
+                "topic_id",
+                "added_at",
+            ] in index_columns, "Missing index on (topic_id, added_at)"
+            assert [
+                "source_id",
+                "added_at",
+            ] in index_columns, "Missing index on (source_id, added_at)"
+
+    def test_migration_creates_check_constraints(self, empty_db_app: Flask) -> None:
+        """Test that migrations create the api_clients name check constraint."""
+        with empty_db_app.app_context():
+            alembic.upgrade()
+
+            inspector = inspect(db.engine)
+            constraint_names = [
+                c["name"] for c in inspector.get_check_constraints("api_clients")
+            ]
+            assert "ck_api_clients_name_no_dot" in constraint_names
+
     def test_migration_idempotency(self, empty_db_app: Flask) -> None:
         """Test that running migrations multiple times is safe (idempotent)."""
         with empty_db_app.app_context():
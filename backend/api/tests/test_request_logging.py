@@ -5,35 +5,36 @@ log the expected information, and don't expose sensitive data.
 """
 
 import logging
+import re
 import time
+from unittest.mock import patch
 
 import pytest
-from flask import Flask
+from flask import Flask, g
 
+from app import _request_logger, create_app
 from app.models.api_client import ApiClient
 
 
 class TestRequestLogging:
     """Test request logging functionality."""
 
-    def test_request_start_logging(
+    def test_single_access_log_line_per_request(
         self, app: Flask, caplog: pytest.LogCaptureFixture
     ) -> None:
-        """Test that request start is logged with expected information."""
+        """Test that each request produces exactly one access log line."""
         with app.test_client() as client:
             with caplog.at_level(logging.INFO):
                 client.get("/")
 
-        # Check that request start was logged
-        start_logs = [
-            record for record in caplog.records if "Request started" in record.message
-        ]
-        assert len(start_logs) == 1
+        # No separate start line is emitted any more
+        assert not any("Request started" in r.message for r in caplog.records)
 
-        start_log = start_logs[0]
-        assert "GET /" in start_log.message
-        assert "from IP" in start_log.message
-        assert "User-Agent" in start_log.message
+        completion_logs = [
+            record for record in caplog.records if "Request completed" in record.message
+        ]
+        assert len(completion_logs) == 1
+        assert "User-Agent" in completion_logs[0].message
 
     def test_request_completion_logging(
         self, app: Flask, caplog: pytest.LogCaptureFixture
@@ -52,7 +53,7 @@ class TestRequestLogging:
         completion_log = completion_logs[0]
         assert "GET /" in completion_log.message
         assert "-> 200" in completion_log.message
-        assert "in" in completion_log.message and "seconds" in completion_log.message
+        assert re.search(r" in \d+ms ", completion_log.message)
         assert "from IP" in completion_log.message
 
     def test_debug_logging_with_query_parameters(
@@ -124,6 +125,18 @@ class TestRequestLogging:
                 if "safe_param" in f"/?{param}=sensitive_value&safe_param=safe_value":
                     assert "safe_param" in debug_log.message
 
+    def test_debug_payloads_skipped_above_debug_level(self, app: Flask) -> None:
+        """Test that DEBUG mode alone does not build payload logs at INFO level."""
+        app.config["DEBUG"] = True
+        app.logger.setLevel(logging.INFO)
+
+        with patch.object(_request_logger, "debug") as mock_debug:
+            with app.test_client() as client:
+                client.get("/?safe_param=safe_value")
+                client.post("/", data={"test": "data"})
+
+        mock_debug.assert_not_called()
+
     def test_request_logging_with_forwarded_ip(
         self, app: Flask, caplog: pytest.LogCaptureFixture
     ) -> None:
@@ -141,6 +154,59 @@ class TestRequestLogging:
         # At least one log should contain the forwarded IP
         assert any("192.168.1.100" in log.message for log in request_logs)
 
+    def test_skipped_paths_are_not_logged(
+        self, app: Flask, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that health-check and static paths produce no access log lines."""
+        with app.test_client() as client:
+            with caplog.at_level(logging.INFO):
+                client.get("/healthz")
+                client.get("/static/missing.css")
+
+        request_logs = [
+            record for record in caplog.records if "Request completed" in record.message
+        ]
+        assert request_logs == []
+
+    def test_skip_prefixes_are_configurable(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that REQUEST_LOG_SKIP_PREFIXES replaces the default prefixes."""
+        app = create_app(
+            {
+                "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+                "TESTING": True,
+                "REQUEST_LOG_SKIP_PREFIXES": ("/internal/",),
+            }
+        )
+
+        with app.test_client() as client:
+            with caplog.at_level(logging.INFO):
+                client.get("/internal/status")
+                client.get("/healthz")
+
+        completed = [
+            r.message for r in caplog.records if "Request completed" in r.message
+        ]
+        assert len(completed) == 1
+        assert "/healthz" in completed[0]
+
+    def test_remote_ip_resolved_once_per_request(self, app: Flask) -> None:
+        """Test that the client IP is stored on g for later handlers."""
+
+        @app.route("/remote-ip")
+        def remote_ip_view() -> str:  # pyright: ignore[reportUnusedFunction]
+            return g.remote_ip
+
+        with app.test_client() as client:
+            forwarded = client.get(
+                "/remote-ip", headers={"X-Forwarded-For": "192.168.1.100"}
+            )
+            direct = client.get("/remote-ip")
+
+        assert forwarded.get_data(as_text=True) == "192.168.1.100"
+        assert direct.get_data(as_text=True) == "127.0.0.1"
+
     def test_authentication_success_logging(
         self,
         app: Flask,
@@ -266,7 +332,7 @@ class TestRequestLogging:
         # Check that all methods were logged
         logged_methods = set()
         for record in caplog.records:
-            if "Request started:" in record.message:
+            if "Request completed:" in record.message:
                 for method in methods_to_test:
                     if f"{method} /" in record.message:
                         logged_methods.add(method)
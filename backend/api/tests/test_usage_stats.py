@@ -0,0 +1,124 @@
+"""Tests for batched API client usage statistics."""
+
+from unittest.mock import MagicMock, patch
+
+from _pytest.logging import LogCaptureFixture
+from flask import Flask
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.extensions import db
+from app.models.api_client import ApiClient
+from app.usage_stats import (
+    DEFAULT_FLUSH_INTERVAL,
+    _flush_all_at_exit,  # pyright: ignore[reportPrivateUsage]
+    usage_stats,
+)
+
+
+class TestUsageStats:
+    """Test cases for the usage statistics buffer."""
+
+    def test_default_flush_interval(self, app: Flask) -> None:
+        """Test that the flush interval defaults when not configured."""
+        assert app.config["USAGE_STATS_FLUSH_INTERVAL"] == DEFAULT_FLUSH_INTERVAL
+
+    def test_record_buffers_until_flush(
+        self, app: Flask, sample_api_client: tuple[ApiClient, str]
+    ) -> None:
+        """Test that recorded uses are not written until the buffer is flushed."""
+        api_client, _api_key = sample_api_client
+        app.config["USAGE_STATS_FLUSH_INTERVAL"] = 3600
+
+        usage_stats.record(api_client.id)
+        usage_stats.record(api_client.id)
+
+        db.session.refresh(api_client)
+        assert api_client.use_count == 0
+        assert api_client.last_used_at is None
+
+        assert usage_stats.flush() == 1
+        db.session.refresh(api_client)
+        assert api_client.use_count == 2
+        assert api_client.last_used_at is not None
+
+    def test_record_flushes_when_interval_elapsed(
+        self, app: Flask, sample_api_client: tuple[ApiClient, str]
+    ) -> None:
+        """Test that recording flushes immediately once the interval has passed."""
+        api_client, _api_key = sample_api_client
+        app.config["USAGE_STATS_FLUSH_INTERVAL"] = 0
+
+        usage_stats.record(api_client.id)
+
+        db.session.refresh(api_client)
+        assert api_client.use_count == 1
+        assert usage_stats.flush() == 0
+
+    def test_flush_batches_multiple_clients(self, app: Flask) -> None:
+        """Test that one flush updates every buffered client."""
+        app.config["USAGE_STATS_FLUSH_INTERVAL"] = 3600
+        clients = [ApiClient.create_with_api_key(f"client-{i}")[0] for i in range(3)]
+        db.session.add_all(clients)
+        db.session.commit()
+
+        for uses, client in enumerate(clients, start=1):
+            for _ in range(uses):
+                usage_stats.record(client.id)
+
+        assert usage_stats.flush() == 3
+        for uses, client in enumerate(clients, start=1):
+            db.session.refresh(client)
+            assert client.use_count == uses
+
+    def test_buffer_flushed_at_exit(
+        self, app: Flask, sample_api_client: tuple[ApiClient, str]
+    ) -> None:
+        """Test that the exit hook writes counts no request has flushed yet."""
+        api_client, _api_key = sample_api_client
+        app.config["USAGE_STATS_FLUSH_INTERVAL"] = 3600
+        usage_stats.record(api_client.id)
+
+        _flush_all_at_exit()
+
+        db.session.refresh(api_client)
+        assert api_client.use_count == 1
+
+    @patch("app.usage_stats._write_usage")
+    def test_flush_failure_keeps_counts(
+        self,
+        mock_write: MagicMock,
+        app: Flask,
+        sample_api_client: tuple[ApiClient, str],
+        caplog: LogCaptureFixture,
+    ) -> None:
+        """Test that a failed flush is logged and retried on the next flush."""
+        api_client, _api_key = sample_api_client
+        app.config["USAGE_STATS_FLUSH_INTERVAL"] = 3600
+        usage_stats.record(api_client.id)
+
+        mock_write.side_effect = SQLAlchemyError("Database connection failed")
+        assert usage_stats.flush() == 0
+        assert "Failed to update usage statistics" in caplog.text
+
+        mock_write.side_effect = None
+        usage_stats.record(api_client.id)
+        assert usage_stats.flush() == 1
+        rows = mock_write.call_args.args[0]
+        assert [(row["client_id"], row["count"]) for row in rows] == [
+            (api_client.id, 2)
+        ]
+
+    def test_buffers_are_isolated_per_app(
+        self, app: Flask, sample_api_client: tuple[ApiClient, str]
+    ) -> None:
+        """Test that each application keeps its own usage buffer."""
+        api_client, _api_key = sample_api_client
+        app.config["USAGE_STATS_FLUSH_INTERVAL"] = 3600
+        usage_stats.record(api_client.id)
+
+        other_app = Flask(__name__)
+        usage_stats.init_app(other_app)
+        with other_app.app_context():
+            assert usage_stats.flush() == 0
+
+        assert usage_stats.flush() == 1